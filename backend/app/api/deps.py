@@ -1,81 +1,217 @@
-from typing import Annotated
+import threading
+import time
+from typing import Annotated, Any, TypeVar
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.core.security import decode_access_token
 from app.db.session import get_db
 from app.models.owner import Owner
 from app.models.user import User
 
-oauth2_scheme_user = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/user/login")
-oauth2_scheme_owner = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/owner/login")
+_UNSET = object()
 
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme_user)],
-    db: Annotated[Session, Depends(get_db)],
-) -> User:
-    unauthorized_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid or expired token.",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+class _RequestCachedBearer(OAuth2PasswordBearer):
+    """OAuth2PasswordBearer that parses the Authorization header once per request.
+
+    The user and owner schemes are separate dependencies, so FastAPI would
+    otherwise run the header parse for each of them.
+    """
+
+    async def __call__(self, request: Request) -> str | None:
+        token = getattr(request.state, "_bearer_token", _UNSET)
+        if token is _UNSET:
+            token = await super().__call__(request)
+            request.state._bearer_token = token
+        return token
+
+
+oauth2_scheme_user = _RequestCachedBearer(
+    tokenUrl="/api/v1/auth/user/login", scheme_name="OAuth2PasswordBearer"
+)
+oauth2_scheme_owner = _RequestCachedBearer(
+    tokenUrl="/api/v1/auth/owner/login", scheme_name="OAuth2PasswordBearer"
+)
+
+# Cross-request identity cache: (table name, id) -> column values of the row.
+# Short TTL bounds staleness; profile writes call invalidate_cached_identity().
+_IDENTITY_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_IDENTITY_CACHE_LOCK = threading.RLock()
+
+# Verified token -> decoded payload, so repeat requests skip the signature
+# check. Hits are still rejected once the token's own exp has passed.
+_TOKEN_PAYLOAD_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_TOKEN_PAYLOAD_CACHE_LOCK = threading.RLock()
+
+_PrincipalT = TypeVar("_PrincipalT", User, Owner)
+
+
+# Raised as-is on every auth failure; nothing is allocated on the happy path.
+_UNAUTHORIZED = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid or expired token.",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+# request.state._auth_cache marker for a token that already failed to decode.
+_FAILED_TOKEN = object()
+
+
+def _decode_token(token: str) -> dict[str, Any] | None:
+    with _TOKEN_PAYLOAD_CACHE_LOCK:
+        payload = _TOKEN_PAYLOAD_CACHE.get(token)
+    if payload is not None and payload["exp"] > time.time():
+        return payload
+
     try:
         payload = decode_access_token(token)
-    except jwt.PyJWTError as exc:
-        raise unauthorized_exception from exc
+    except jwt.PyJWTError:
+        return None
+    with _TOKEN_PAYLOAD_CACHE_LOCK:
+        _TOKEN_PAYLOAD_CACHE[token] = payload
+    return payload
+
+
+def _get_auth_cache_entry(request: Request, token: str) -> dict[str, Any]:
+    """Decode `token` at most once per request; later lookups reuse request.state."""
+    auth_cache = getattr(request.state, "_auth_cache", None)
+    if auth_cache is None:
+        auth_cache = {}
+        request.state._auth_cache = auth_cache
+
+    entry = auth_cache.get(token)
+    if entry is None:
+        payload = _decode_token(token)
+        if payload is None:
+            # Remember the failure so sibling dependencies don't decode again.
+            auth_cache[token] = _FAILED_TOKEN
+            raise _UNAUTHORIZED
+        entry = {"payload": payload, "principal": None, "rejected": set()}
+        auth_cache[token] = entry
+    elif entry is _FAILED_TOKEN:
+        raise _UNAUTHORIZED
+    return entry
 
-    token_type = payload.get("token_type", "user")
-    if token_type != "user":
-        raise unauthorized_exception
 
+def _subject_id(payload: dict[str, Any]) -> int:
     subject = payload.get("sub")
-    if not subject:
-        raise unauthorized_exception
+    if isinstance(subject, str) and subject.isascii() and subject.isdigit():
+        return int(subject)
+    if isinstance(subject, int) and not isinstance(subject, bool):
+        return subject
+    raise _UNAUTHORIZED
 
-    try:
-        user_id = int(subject)
-    except (TypeError, ValueError) as exc:
-        raise unauthorized_exception from exc
 
-    user = db.execute(select(User).where(User.id == user_id)).scalar_one_or_none()
+def _load_principal(db: Session, model: type[_PrincipalT], principal_id: int) -> _PrincipalT | None:
+    cache_key = (model.__tablename__, principal_id)
+    with _IDENTITY_CACHE_LOCK:
+        cached = _IDENTITY_CACHE.get(cache_key)
+
+    if cached is not None:
+        # Rebuild a clean detached instance and attach it without a SELECT.
+        instance = model(**cached)
+        make_transient_to_detached(instance)
+        return db.merge(instance, load=False)
+
+    instance = db.get(model, principal_id)
+    if instance is not None:
+        values = {attr.key: getattr(instance, attr.key) for attr in model.__mapper__.column_attrs}
+        with _IDENTITY_CACHE_LOCK:
+            _IDENTITY_CACHE[cache_key] = values
+    return instance
+
+
+def invalidate_cached_identity(model: type[User] | type[Owner], principal_id: int) -> None:
+    with _IDENTITY_CACHE_LOCK:
+        _IDENTITY_CACHE.pop((model.__tablename__, principal_id), None)
+
+
+def get_access_token_payload(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme_user)],
+) -> dict[str, Any]:
+    """Decoded payload of a user OR owner bearer token (token_type is not checked)."""
+    return _get_auth_cache_entry(request, token)["payload"]
+
+
+def get_current_user(
+    request: Request,
+    token: Annotated[str, Depends(oauth2_scheme_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    entry = _get_auth_cache_entry(request, token)
+    if isinstance(entry["principal"], User):
+        return entry["principal"]
+    if User in entry["rejected"]:
+        raise _UNAUTHORIZED
+
+    payload = entry["payload"]
+    if payload.get("token_type", "user") != "user":
+        raise _UNAUTHORIZED
+
+    user_id = _subject_id(payload)
+    user = _load_principal(db, User, user_id)
     if user is None:
-        raise unauthorized_exception
+        entry["rejected"].add(User)
+        raise _UNAUTHORIZED
+    entry["principal"] = user
     return user
 
 
 def get_current_owner(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme_owner)],
     db: Annotated[Session, Depends(get_db)],
 ) -> Owner:
-    unauthorized_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid or expired token.",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = decode_access_token(token)
-    except jwt.PyJWTError as exc:
-        raise unauthorized_exception from exc
-
-    token_type = payload.get("token_type")
-    if token_type != "owner":
-        raise unauthorized_exception
+    entry = _get_auth_cache_entry(request, token)
+    if isinstance(entry["principal"], Owner):
+        return entry["principal"]
+    if Owner in entry["rejected"]:
+        raise _UNAUTHORIZED
 
-    subject = payload.get("sub")
-    if not subject:
-        raise unauthorized_exception
+    payload = entry["payload"]
+    if payload.get("token_type") != "owner":
+        raise _UNAUTHORIZED
 
-    try:
-        owner_id = int(subject)
-    except (TypeError, ValueError) as exc:
-        raise unauthorized_exception from exc
-
-    owner = db.execute(select(Owner).where(Owner.id == owner_id)).scalar_one_or_none()
+    owner_id = _subject_id(payload)
+    owner = _load_principal(db, Owner, owner_id)
     if owner is None:
-        raise unauthorized_exception
+        entry["rejected"].add(Owner)
+        raise _UNAUTHORIZED
+    entry["principal"] = owner
     return owner
+
+
+def _reload_principal(db: Session, principal: _PrincipalT) -> _PrincipalT:
+    # populate_existing overwrites the snapshot in place, so attribute history
+    # is computed against the live row rather than the cached column values.
+    fresh = db.get(type(principal), principal.id, populate_existing=True)
+    if fresh is None:
+        raise _UNAUTHORIZED
+    return fresh
+
+
+def get_current_user_for_update(
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[Session, Depends(get_db)],
+) -> User:
+    """get_current_user re-read from the database, for endpoints that diff or write its columns.
+
+    get_current_user may return an identity-cache snapshot up to its TTL old;
+    keep that for read-only routes.
+    """
+    return _reload_principal(db, current_user)
+
+
+def get_current_owner_for_update(
+    current_owner: Annotated[Owner, Depends(get_current_owner)],
+    db: Annotated[Session, Depends(get_db)],
+) -> Owner:
+    """get_current_owner re-read from the database; see get_current_user_for_update."""
+    return _reload_principal(db, current_owner)
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
@@ -10,7 +11,6 @@ from app.db.session import get_db
 from app.models.user import User
 from app.schemas.ai_assistant import AIChatRequest, AIChatResponse
 from app.services import ai_assistant_service
-from app.services.errors import ServiceBadRequest
 
 router = APIRouter(prefix="/ai-assistant", tags=["ai-assistant"])
 
@@ -21,12 +21,29 @@ def chat_with_ai_assistant(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> AIChatResponse:
-    try:
-        return ai_assistant_service.generate_chat_response(
-            db=db,
-            user_id=current_user.id,
-            message=payload.message,
-            conversation_history=payload.conversation_history,
-        )
-    except ServiceBadRequest as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return ai_assistant_service.generate_chat_response(
+        db=db,
+        user_id=current_user.id,
+        message=payload.message,
+        conversation_history=payload.conversation_history,
+    )
+
+
+@router.post(
+    "/chat/stream",
+    summary="Chat with the AI restaurant assistant, streaming the reply as server-sent events",
+)
+def stream_chat_with_ai_assistant(
+    payload: AIChatRequest,
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> StreamingResponse:
+    events = ai_assistant_service.stream_chat_response(
+        db=db,
+        user_id=current_user.id,
+        message=payload.message,
+        conversation_history=payload.conversation_history,
+    )
+    # Starlette iterates sync generators in its threadpool, so a slow LLM
+    # stream never blocks the event loop.
+    return StreamingResponse(events, media_type="text/event-stream")
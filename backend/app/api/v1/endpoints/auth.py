@@ -1,12 +1,19 @@
+import secrets
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_cached_identity
 from app.core.config import get_settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    create_access_token,
+    get_password_hash,
+    password_needs_rehash,
+    verify_password,
+)
 from app.db.session import get_db
 from app.models.owner import Owner
 from app.models.user import User
@@ -22,42 +29,72 @@ from app.schemas.auth import (
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_ACCESS_TOKEN_EXPIRE_MINUTES = get_settings().jwt_access_token_expire_minutes
 
-def _signup_user(payload: SignupRequest, db: Session) -> AuthUserResponse:
-    email = payload.email.strip().lower()
+# Verified against when the email is unknown, so a miss costs the same hash
+# work as a wrong password and response time doesn't reveal account existence.
+_DUMMY_PASSWORD_HASH = get_password_hash(secrets.token_urlsafe(32))
 
-    existing_user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
-    if existing_user is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already exists.",
-        )
+# Built once and cached by SQLAlchemy; callers pass {"email": ...} per execute.
+# Only the credential columns are read; the full row is loaded after a match.
+_USER_CREDENTIALS_BY_EMAIL = lambda_stmt(
+    lambda: select(User.id, User.password_hash).where(User.email == bindparam("email"))
+)
+_OWNER_CREDENTIALS_BY_EMAIL = lambda_stmt(
+    lambda: select(Owner.id, Owner.password_hash).where(Owner.email == bindparam("email"))
+)
 
+
+def _email_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Email already exists.",
+    )
+
+
+def _rehash_password_if_needed(db: Session, account: User | Owner, password: str) -> None:
+    """Upgrade legacy bcrypt / outdated Argon2 hashes after a successful login."""
+    if not password_needs_rehash(account.password_hash):
+        return
+    account.password_hash = get_password_hash(password)
+    db.commit()
+    invalidate_cached_identity(type(account), account.id)
+
+
+def _signup_user(payload: SignupRequest, db: Session) -> AuthUserResponse:
+    # uk_users_email enforces uniqueness; no SELECT pre-check, no race window.
     user = User(
         name=payload.name.strip(),
-        email=email,
+        email=payload.email,
         password_hash=get_password_hash(payload.password),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise _email_conflict()
     return AuthUserResponse.model_validate(user)
 
 
 def _login_user(payload: LoginRequest, db: Session) -> LoginResponse:
-    email = payload.email.strip().lower()
-    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
+    credentials = db.execute(_USER_CREDENTIALS_BY_EMAIL, {"email": payload.email}).first()
 
-    if user is None or not verify_password(payload.password, user.password_hash):
+    password_ok = verify_password(
+        payload.password,
+        credentials.password_hash if credentials is not None else _DUMMY_PASSWORD_HASH,
+    )
+    if not (password_ok & (credentials is not None)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
         )
+    user = db.get(User, credentials.id)
+    _rehash_password_if_needed(db, user, payload.password)
 
-    settings = get_settings()
     token = create_access_token(
         subject=str(user.id),
-        expires_minutes=settings.jwt_access_token_expire_minutes,
+        expires_minutes=_ACCESS_TOKEN_EXPIRE_MINUTES,
         token_type="user",
     )
     return LoginResponse(
@@ -67,21 +104,15 @@ def _login_user(payload: LoginRequest, db: Session) -> LoginResponse:
     )
 
 
+# /signup and /login are the original paths the frontend uses; /user/* mirrors
+# the /owner/* naming and is the OAuth2 tokenUrl. Both map to one handler.
 @router.post("/signup", response_model=AuthUserResponse, status_code=status.HTTP_201_CREATED)
-def signup(payload: SignupRequest, db: Session = Depends(get_db)) -> AuthUserResponse:
-    return _signup_user(payload, db)
-
-
-@router.post("/login", response_model=LoginResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
-    return _login_user(payload, db)
-
-
 @router.post("/user/signup", response_model=AuthUserResponse, status_code=status.HTTP_201_CREATED)
 def signup_user(payload: SignupRequest, db: Session = Depends(get_db)) -> AuthUserResponse:
     return _signup_user(payload, db)
 
 
+@router.post("/login", response_model=LoginResponse)
 @router.post("/user/login", response_model=LoginResponse)
 def login_user(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
     return _login_user(payload, db)
@@ -89,42 +120,41 @@ def login_user(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginRes
 
 @router.post("/owner/signup", response_model=AuthOwnerResponse, status_code=status.HTTP_201_CREATED)
 def signup_owner(payload: OwnerSignupRequest, db: Session = Depends(get_db)) -> AuthOwnerResponse:
-    email = payload.email.strip().lower()
-
-    existing_owner = db.execute(select(Owner).where(Owner.email == email)).scalar_one_or_none()
-    if existing_owner is not None:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already exists.",
-        )
-
+    # uk_owners_email enforces uniqueness; no SELECT pre-check, no race window.
     owner = Owner(
         name=payload.name.strip(),
-        email=email,
+        email=payload.email,
         password_hash=get_password_hash(payload.password),
         restaurant_location=payload.restaurant_location.strip(),
     )
     db.add(owner)
-    db.commit()
-    db.refresh(owner)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise _email_conflict()
     return AuthOwnerResponse.model_validate(owner)
 
 
 @router.post("/owner/login", response_model=OwnerLoginResponse)
 def login_owner(payload: LoginRequest, db: Session = Depends(get_db)) -> OwnerLoginResponse:
-    email = payload.email.strip().lower()
-    owner = db.execute(select(Owner).where(Owner.email == email)).scalar_one_or_none()
+    credentials = db.execute(_OWNER_CREDENTIALS_BY_EMAIL, {"email": payload.email}).first()
 
-    if owner is None or not verify_password(payload.password, owner.password_hash):
+    password_ok = verify_password(
+        payload.password,
+        credentials.password_hash if credentials is not None else _DUMMY_PASSWORD_HASH,
+    )
+    if not (password_ok & (credentials is not None)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
         )
+    owner = db.get(Owner, credentials.id)
+    _rehash_password_if_needed(db, owner, payload.password)
 
-    settings = get_settings()
     token = create_access_token(
         subject=str(owner.id),
-        expires_minutes=settings.jwt_access_token_expire_minutes,
+        expires_minutes=_ACCESS_TOKEN_EXPIRE_MINUTES,
         token_type="owner",
     )
     return OwnerLoginResponse(
@@ -14,7 +14,7 @@ Design notes:
 """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
@@ -26,7 +26,6 @@ from app.schemas.favorite import (
     UserHistoryResponse,
 )
 from app.services import favorite_service
-from app.services.errors import ServiceConflict, ServiceNotFound
 
 router = APIRouter(tags=["favorites"])
 
@@ -42,12 +41,7 @@ def add_favorite(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> FavoriteStatusResponse:
-    try:
-        return favorite_service.add_favorite(db, restaurant_id, current_user.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceConflict as exc:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return favorite_service.add_favorite(db, restaurant_id, current_user.id)
 
 
 @router.delete(
@@ -61,10 +55,7 @@ def remove_favorite(
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
     """Returns 404 if the restaurant is not currently in the user's favorites."""
-    try:
-        favorite_service.remove_favorite(db, restaurant_id, current_user.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    favorite_service.remove_favorite(db, restaurant_id, current_user.id)
 
 
 @router.get(
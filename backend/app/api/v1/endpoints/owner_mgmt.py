@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_owner
@@ -25,12 +25,8 @@ from app.schemas.owner import (
     OwnerRestaurantUpdate,
 )
 from app.schemas.restaurant import RestaurantCreate, RestaurantResponse
+from app.schemas.review import ReviewListResponse
 from app.services import owner_service
-from app.services.errors import (
-    ServiceConflict,
-    ServiceForbidden,
-    ServiceNotFound,
-)
 
 router = APIRouter(prefix="/owner", tags=["owner-management"])
 
@@ -68,12 +64,7 @@ def update_restaurant(
     db: Annotated[Session, Depends(get_db)],
     current_owner: Annotated[Owner, Depends(get_current_owner)],
 ) -> RestaurantResponse:
-    try:
-        return owner_service.update_owner_restaurant(db, restaurant_id, payload, current_owner.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceForbidden as exc:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+    return owner_service.update_owner_restaurant(db, restaurant_id, payload, current_owner.id)
 
 
 # ---------------------------------------------------------------------------
@@ -91,12 +82,7 @@ def claim_restaurant(
     db: Annotated[Session, Depends(get_db)],
     current_owner: Annotated[Owner, Depends(get_current_owner)],
 ) -> ClaimResponse:
-    try:
-        return owner_service.claim_restaurant(db, restaurant_id, current_owner.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceConflict as exc:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return owner_service.claim_restaurant(db, restaurant_id, current_owner.id)
 
 
 # ---------------------------------------------------------------------------
@@ -105,6 +91,7 @@ def claim_restaurant(
 
 @router.get(
     "/restaurants/{restaurant_id}/reviews",
+    response_model=ReviewListResponse,
     summary="List reviews for a restaurant you have claimed",
 )
 def list_restaurant_reviews(
@@ -114,14 +101,9 @@ def list_restaurant_reviews(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=20, ge=1, le=100),
 ) -> dict:
-    try:
-        return owner_service.get_owner_restaurant_reviews(
-            db, restaurant_id, current_owner.id, page=page, limit=limit
-        )
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceForbidden as exc:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+    return owner_service.get_owner_restaurant_reviews(
+        db, restaurant_id, current_owner.id, page=page, limit=limit
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -2,7 +2,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends
 
-from app.api.deps import get_current_owner
+from app.api.deps import get_current_owner, get_current_owner_for_update, invalidate_cached_identity
 from app.db.session import get_db
 from app.models.owner import Owner
 from app.schemas.auth import AuthOwnerResponse
@@ -22,6 +22,8 @@ def get_owner_me(current_owner: Annotated[Owner, Depends(get_current_owner)]) ->
 def update_owner_me(
     payload: OwnerProfileUpdate,
     db: Annotated[Session, Depends(get_db)],
-    current_owner: Annotated[Owner, Depends(get_current_owner)],
+    current_owner: Annotated[Owner, Depends(get_current_owner_for_update)],
 ) -> OwnerProfileResponse:
-    return owner_service.update_owner_profile(db, current_owner, payload)
+    profile = owner_service.update_owner_profile(db, current_owner, payload)
+    invalidate_cached_identity(Owner, current_owner.id)
+    return profile
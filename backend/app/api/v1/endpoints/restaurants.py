@@ -12,12 +12,10 @@ from __future__ import annotations
 
 from typing import Annotated, Optional
 
-import jwt as pyjwt
 from fastapi import (
     APIRouter,
     Depends,
     File,
-    HTTPException,
     Query,
     Request,
     UploadFile,
@@ -25,22 +23,17 @@ from fastapi import (
 )
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.core.security import decode_access_token
+from app.api.deps import get_access_token_payload, get_current_user
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.restaurant import (
+    PhotoUploadResponse,
     RestaurantCreate,
     RestaurantResponse,
     RestaurantSearchResponse,
+    UploadedPhoto,
 )
 from app.services import restaurant_service
-from app.services.errors import (
-    ServiceBadRequest,
-    ServiceForbidden,
-    ServiceNotFound,
-    ServiceUnauthorized,
-)
 
 router = APIRouter(prefix="/restaurants", tags=["restaurants"])
 
@@ -116,10 +109,7 @@ def get_restaurant(
     restaurant_id: int,
     db: Annotated[Session, Depends(get_db)],
 ) -> RestaurantResponse:
-    try:
-        return restaurant_service.get_restaurant_by_id(db, restaurant_id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
+    return restaurant_service.get_restaurant_by_id(db, restaurant_id)
 
 
 # ---------------------------------------------------------------------------
@@ -128,6 +118,7 @@ def get_restaurant(
 
 @router.post(
     "/{restaurant_id}/photos",
+    response_model=PhotoUploadResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Upload photos for a restaurant (owner or creator)",
 )
@@ -135,41 +126,18 @@ async def upload_restaurant_photos(
     restaurant_id: int,
     request: Request,
     db: Annotated[Session, Depends(get_db)],
+    token_payload: Annotated[dict, Depends(get_access_token_payload)],
     files: list[UploadFile] = File(..., description="Up to 5 image files"),
-) -> dict:
-    # ── Decode JWT (HTTP-layer concern; stays in endpoint) ───────────────────
-    auth_header = request.headers.get("Authorization", "")
-    if not auth_header.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    raw_token = auth_header[7:]
-    try:
-        token_payload = decode_access_token(raw_token)
-    except pyjwt.PyJWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token.",
-        )
-
-    # ── Delegate to service ──────────────────────────────────────────────────
-    try:
-        photos = await restaurant_service.upload_photos(
-            db,
-            restaurant_id,
-            files,
-            token_payload,
-            str(request.base_url),
-        )
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceUnauthorized as exc:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc))
-    except ServiceForbidden as exc:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
-    except ServiceBadRequest as exc:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
-
-    return {"photos": [{"id": p.id, "photo_url": p.photo_url} for p in photos]}
+) -> PhotoUploadResponse:
+    # Token is decoded once by get_access_token_payload (cached on request.state).
+    photos = await restaurant_service.upload_photos(
+        db,
+        restaurant_id,
+        files,
+        token_payload,
+        str(request.base_url),
+    )
+
+    return PhotoUploadResponse(
+        photos=[UploadedPhoto(id=p.id, photo_url=p.photo_url) for p in photos]
+    )
@@ -10,21 +10,16 @@ DELETE /api/v1/reviews/{id}               delete own review (User JWT)
 """
 from __future__ import annotations
 
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
-from app.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
+from app.schemas.review import ReviewCreate, ReviewListResponse, ReviewResponse, ReviewUpdate
 from app.services import review_service
-from app.services.errors import (
-    ServiceConflict,
-    ServiceForbidden,
-    ServiceNotFound,
-)
 
 router = APIRouter(tags=["reviews"])
 
@@ -45,10 +40,7 @@ def create_review(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> ReviewResponse:
-    try:
-        return review_service.create_review(db, restaurant_id, payload, current_user.id)
-    except ServiceConflict as exc:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return review_service.create_review(db, restaurant_id, payload, current_user.id)
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +49,7 @@ def create_review(
 
 @router.get(
     "/restaurants/{restaurant_id}/reviews",
+    response_model=ReviewListResponse,
     summary="List reviews for a restaurant",
 )
 def list_reviews(
@@ -64,8 +57,15 @@ def list_reviews(
     db: Annotated[Session, Depends(get_db)],
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=20, ge=1, le=100),
+    after_id: Optional[int] = Query(
+        default=None,
+        ge=1,
+        description="Keyset cursor: id of the last review already seen (overrides page)",
+    ),
 ) -> dict:
-    return review_service.get_reviews_for_restaurant(db, restaurant_id, page=page, limit=limit)
+    return review_service.get_reviews_for_restaurant(
+        db, restaurant_id, page=page, limit=limit, after_id=after_id
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -83,12 +83,7 @@ def update_review(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> ReviewResponse:
-    try:
-        return review_service.update_review(db, review_id, payload, current_user.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceForbidden as exc:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+    return review_service.update_review(db, review_id, payload, current_user.id)
 
 
 # ---------------------------------------------------------------------------
@@ -105,9 +100,4 @@ def delete_review(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> None:
-    try:
-        review_service.delete_review(db, review_id, current_user.id)
-    except ServiceNotFound as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc))
-    except ServiceForbidden as exc:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc))
+    review_service.delete_review(db, review_id, current_user.id)
@@ -1,11 +1,11 @@
-import uuid
+import os
+import secrets
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_current_user_for_update, invalidate_cached_identity
 from app.core.config import get_settings
 from app.db.session import get_db
 from app.models.user import User
@@ -22,9 +22,11 @@ router = APIRouter(prefix="/users", tags=["users"])
 settings = get_settings()
 avatars_dir = settings.uploads_dir / "avatars"
 avatars_dir.mkdir(parents=True, exist_ok=True)
+avatar_url_prefix = "/uploads/avatars/"
 allowed_avatar_extensions = {".jpg", ".jpeg", ".png", ".webp"}
-allowed_avatar_mime_types = {"image/jpeg", "image/png", "image/webp"}
+avatar_sniff_size_bytes = 12
 max_avatar_size_bytes = 5 * 1024 * 1024
+avatar_chunk_size_bytes = 64 * 1024
 
 
 def _serialize_languages(languages: list[str] | None) -> str | None:
@@ -71,9 +73,18 @@ def _to_preferences_response(preferences: UserPreference | None) -> UserPreferen
     )
 
 
+def _is_supported_avatar_image(header: bytes) -> bool:
+    """Check the leading bytes for a JPEG, PNG or WEBP signature."""
+    return (
+        header.startswith(b"\xff\xd8\xff")
+        or header.startswith(b"\x89PNG\r\n\x1a\n")
+        or (header[:4] == b"RIFF" and header[8:12] == b"WEBP")
+    )
+
+
 def _build_avatar_url(request: Request, filename: str) -> str:
-    base_url = str(request.base_url).rstrip("/")
-    return f"{base_url}/uploads/avatars/{filename}"
+    # Absolute: the SPA is served from another origin and uses this as <img src>.
+    return f"{str(request.base_url).rstrip('/')}{avatar_url_prefix}{filename}"
 
 
 @router.get("/me", response_model=UserProfileResponse)
@@ -85,31 +96,35 @@ def get_me(current_user: Annotated[User, Depends(get_current_user)]) -> UserProf
 def update_me(
     payload: UserProfileUpdateRequest,
     db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_user)],
+    current_user: Annotated[User, Depends(get_current_user_for_update)],
 ) -> UserProfileResponse:
     updates = payload.model_dump(exclude_unset=True)
-
     if "languages" in updates:
-        current_user.languages = _parse_languages(updates.pop("languages"))
+        updates["languages"] = _parse_languages(updates["languages"])
+
+    # A re-saved, unchanged form sends every field; skip the transaction then too.
+    updates = {
+        field: value for field, value in updates.items() if getattr(current_user, field) != value
+    }
+    if not updates:
+        return _to_profile_response(current_user)
 
     for field, value in updates.items():
         setattr(current_user, field, value)
 
+    # The flush UPDATEs only the changed columns; no refresh is needed because
+    # the response carries no server-generated values.
     db.add(current_user)
     db.commit()
-    db.refresh(current_user)
+    invalidate_cached_identity(User, current_user.id)
     return _to_profile_response(current_user)
 
 
 @router.get("/me/preferences", response_model=UserPreferencesResponse)
 def get_my_preferences(
-    db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> UserPreferencesResponse:
-    preferences = db.execute(
-        select(UserPreference).where(UserPreference.user_id == current_user.id)
-    ).scalar_one_or_none()
-    return _to_preferences_response(preferences)
+    return _to_preferences_response(current_user.preferences)
 
 
 @router.put("/me/preferences", response_model=UserPreferencesResponse)
@@ -118,19 +133,23 @@ def update_my_preferences(
     db: Annotated[Session, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
 ) -> UserPreferencesResponse:
-    preferences = db.execute(
-        select(UserPreference).where(UserPreference.user_id == current_user.id)
-    ).scalar_one_or_none()
+    preferences = current_user.preferences
+    updates = payload.model_dump(exclude_unset=True)
+    if preferences is not None:
+        updates = {
+            field: value for field, value in updates.items() if getattr(preferences, field) != value
+        }
+        if not updates:
+            return _to_preferences_response(preferences)
+
     if preferences is None:
-        preferences = UserPreference(user_id=current_user.id, sort_preference="rating")
+        preferences = UserPreference(sort_preference="rating")
+        current_user.preferences = preferences
 
-    updates = payload.model_dump(exclude_unset=True)
     for field, value in updates.items():
         setattr(preferences, field, value)
 
-    db.add(preferences)
     db.commit()
-    db.refresh(preferences)
     return _to_preferences_response(preferences)
 
 
@@ -145,29 +164,45 @@ async def upload_my_avatar(
     request: Request,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_for_update),
 ) -> AvatarUploadResponse:
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file selected.")
 
-    extension = f".{file.filename.rsplit('.', 1)[-1].lower()}" if "." in file.filename else ""
+    extension = os.path.splitext(file.filename)[1].lower()
     if extension not in allowed_avatar_extensions:
         raise HTTPException(status_code=400, detail="Unsupported image format.")
 
-    if file.content_type not in allowed_avatar_mime_types:
+    # Trust the file's signature, not the client-supplied content type; a bad
+    # upload is rejected after reading 12 bytes.
+    header = await file.read(avatar_sniff_size_bytes)
+    if not _is_supported_avatar_image(header):
         raise HTTPException(status_code=400, detail="Only JPEG, PNG, and WEBP images are supported.")
 
-    file_bytes = await file.read()
-    if len(file_bytes) > max_avatar_size_bytes:
-        raise HTTPException(status_code=413, detail="Image size must be 5MB or less.")
-
-    filename = f"user-{current_user.id}-{uuid.uuid4().hex}{extension}"
+    filename = f"user-{current_user.id}-{secrets.token_hex(16)}{extension}"
     destination_path = avatars_dir / filename
-    destination_path.write_bytes(file_bytes)
 
-    current_user.avatar_url = _build_avatar_url(request, filename)
-    db.add(current_user)
-    db.commit()
-    db.refresh(current_user)
+    # Copy in fixed-size chunks so an upload never sits in memory whole, and
+    # stop as soon as the size limit is crossed. Any failure before the commit
+    # (oversize, client disconnect, disk error, DB error) removes the partial file.
+    total_bytes = len(header)
+    try:
+        with open(destination_path, "wb") as destination:
+            destination.write(header)
+            while chunk := await file.read(avatar_chunk_size_bytes):
+                total_bytes += len(chunk)
+                if total_bytes > max_avatar_size_bytes:
+                    break
+                destination.write(chunk)
+        if total_bytes > max_avatar_size_bytes:
+            raise HTTPException(status_code=413, detail="Image size must be 5MB or less.")
+
+        current_user.avatar_url = _build_avatar_url(request, filename)
+        db.add(current_user)
+        db.commit()
+    except BaseException:
+        destination_path.unlink(missing_ok=True)
+        raise
+    invalidate_cached_identity(User, current_user.id)
 
     return AvatarUploadResponse(avatar_url=current_user.avatar_url)
@@ -10,13 +10,20 @@ from app.api.v1.endpoints.restaurants import router as restaurants_router
 from app.api.v1.endpoints.reviews import router as reviews_router
 from app.api.v1.endpoints.users import router as users_router
 
+# Inclusion order is route-matching order.
+ROUTERS = (
+    health_router,
+    auth_router,
+    owners_router,
+    owner_mgmt_router,
+    users_router,
+    restaurants_router,
+    reviews_router,
+    favorites_router,
+    ai_assistant_router,
+)
+
 api_router = APIRouter()
-api_router.include_router(health_router)
-api_router.include_router(auth_router)
-api_router.include_router(owners_router)
-api_router.include_router(owner_mgmt_router)
-api_router.include_router(users_router)
-api_router.include_router(restaurants_router)
-api_router.include_router(reviews_router)
-api_router.include_router(favorites_router)
-api_router.include_router(ai_assistant_router)
+for _router in ROUTERS:
+    api_router.include_router(_router)
+del _router
@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from urllib.parse import quote_plus
 
@@ -17,12 +17,20 @@ class Settings(BaseSettings):
     mysql_user: str = "root"
     mysql_password: str = ""
     mysql_db: str = "yelp_lab1"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
 
     jwt_secret_key: str = "change-this-in-env"
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 60
+    # Argon2id cost; OWASP's floor is time_cost=2, memory 19456 KiB, parallelism 1.
+    password_hash_time_cost: int = 3
+    password_hash_memory_kib: int = 65536
+    password_hash_parallelism: int = 2
     cors_origins: str = "http://127.0.0.1:5173,http://localhost:5173"
     uploads_dir_name: str = "uploads"
+    serve_uploads: bool = True
     startup_db_check_enabled: bool = True
     startup_db_check_strict: bool = False
 
@@ -39,7 +47,8 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-    @property
+    # Derived values are computed once per Settings instance (get_settings() is cached).
+    @cached_property
     def database_url(self) -> str:
         password = quote_plus(self.mysql_password)
         return (
@@ -47,11 +56,11 @@ class Settings(BaseSettings):
             f"@{self.mysql_host}:{self.mysql_port}/{self.mysql_db}?charset=utf8mb4"
         )
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
-    @property
+    @cached_property
     def uploads_dir(self) -> Path:
         return BASE_DIR / self.uploads_dir_name
 
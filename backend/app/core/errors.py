@@ -3,6 +3,33 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.services.errors import (
+    ServiceBadRequest,
+    ServiceConflict,
+    ServiceForbidden,
+    ServiceNotFound,
+    ServiceUnauthorized,
+)
+
+_STATUS_CODE_NAMES: dict[int, str] = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    409: "CONFLICT",
+    422: "VALIDATION_ERROR",
+}
+_DEFAULT_ERROR_MESSAGE = "Request failed."
+
+_SERVICE_ERROR_STATUS: dict[type[Exception], int] = {
+    ServiceBadRequest: 400,
+    ServiceUnauthorized: 401,
+    ServiceForbidden: 403,
+    ServiceNotFound: 404,
+    ServiceConflict: 409,
+}
+
 
 def _build_error_response(status_code: int, code: str, message: str) -> JSONResponse:
     return JSONResponse(
@@ -17,16 +44,17 @@ def _build_error_response(status_code: int, code: str, message: str) -> JSONResp
 
 
 def _http_status_to_code(status_code: int) -> str:
-    status_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        409: "CONFLICT",
-        422: "VALIDATION_ERROR",
-    }
-    return status_map.get(status_code, f"HTTP_{status_code}")
+    return _STATUS_CODE_NAMES.get(status_code) or f"HTTP_{status_code}"
+
+
+def _service_error_handler(status_code: int):
+    code = _http_status_to_code(status_code)
+
+    async def handle_service_error(_: Request, exc: Exception) -> JSONResponse:
+        message = str(exc) or _DEFAULT_ERROR_MESSAGE
+        return _build_error_response(status_code, code, message)
+
+    return handle_service_error
 
 
 def register_exception_handlers(app: FastAPI) -> None:
@@ -35,15 +63,18 @@ def register_exception_handlers(app: FastAPI) -> None:
         _: Request, exc: StarletteHTTPException
     ) -> JSONResponse:
         code = _http_status_to_code(exc.status_code)
-        message = str(exc.detail) if exc.detail else "Request failed."
+        message = str(exc.detail) if exc.detail else _DEFAULT_ERROR_MESSAGE
         return _build_error_response(exc.status_code, code, message)
 
     @app.exception_handler(HTTPException)
     async def handle_http_exception(_: Request, exc: HTTPException) -> JSONResponse:
         code = _http_status_to_code(exc.status_code)
-        message = str(exc.detail) if exc.detail else "Request failed."
+        message = str(exc.detail) if exc.detail else _DEFAULT_ERROR_MESSAGE
         return _build_error_response(exc.status_code, code, message)
 
+    for error_class, status_code in _SERVICE_ERROR_STATUS.items():
+        app.add_exception_handler(error_class, _service_error_handler(status_code))
+
     @app.exception_handler(RequestValidationError)
     async def handle_validation_exception(
         _: Request, exc: RequestValidationError
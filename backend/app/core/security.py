@@ -3,20 +3,59 @@ from typing import Any
 
 import bcrypt
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 
 from app.core.config import get_settings
 
+_settings = get_settings()
 
+# Argon2id, built once at import. Changing the cost settings makes existing
+# hashes report needs-rehash, so they are upgraded on the next login.
+_password_hasher = PasswordHasher(
+    time_cost=_settings.password_hash_time_cost,
+    memory_cost=_settings.password_hash_memory_kib,
+    parallelism=_settings.password_hash_parallelism,
+    hash_len=32,
+    salt_len=16,
+)
+# Hashes created before the Argon2 switch (and the seed data) are bcrypt.
+_BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+# JWT signing context, resolved once from settings (fixed for the process).
+# Key pre-encoded so PyJWT's HMAC path skips the str -> bytes step per token.
+_JWT_KEY = _settings.jwt_secret_key.encode("utf-8")
+_JWT_ALGORITHM = _settings.jwt_algorithm
+_JWT_ALGORITHMS = (_JWT_ALGORITHM,)
+_JWT_DECODE_OPTIONS = {"require": ["sub", "exp"]}
+_jwt_codec = jwt.PyJWT()
+
+
+# verify_password / get_password_hash are CPU-bound (tens of ms) and release
+# the GIL while hashing. The auth endpoints are plain `def` so FastAPI runs
+# them in its threadpool; an `async def` caller must wrap these in
+# `await run_in_threadpool(...)` instead of calling them on the event loop.
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    plain_password_bytes = plain_password.encode("utf-8")
-    hashed_password_bytes = hashed_password.encode("utf-8")
-    return bcrypt.checkpw(plain_password_bytes, hashed_password_bytes)
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    try:
+        return _password_hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False
 
 
 def get_password_hash(password: str) -> str:
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password_bytes, salt).decode("utf-8")
+    return _password_hasher.hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True for legacy bcrypt hashes and Argon2 hashes made with other parameters."""
+    if hashed_password.startswith(_BCRYPT_PREFIXES):
+        return True
+    try:
+        return _password_hasher.check_needs_rehash(hashed_password)
+    except InvalidHashError:
+        return True
 
 
 def create_access_token(subject: str, expires_minutes: int, token_type: str = "user") -> str:
@@ -27,10 +66,13 @@ def create_access_token(subject: str, expires_minutes: int, token_type: str = "u
         "iat": int(now.timestamp()),
         "exp": int((now + timedelta(minutes=expires_minutes)).timestamp()),
     }
-    settings = get_settings()
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _jwt_codec.encode(payload, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
 
 def decode_access_token(token: str) -> dict[str, Any]:
-    settings = get_settings()
-    return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    return _jwt_codec.decode(
+        token,
+        _JWT_KEY,
+        algorithms=_JWT_ALGORITHMS,
+        options=_JWT_DECODE_OPTIONS,
+    )
@@ -1,6 +1,18 @@
+from sqlalchemy import MetaData
 from sqlalchemy.orm import DeclarativeBase
 
+# Names for indexes/unique constraints declared without an explicit name
+# (index=True, unique=True). The patterns reproduce the names the db/*.sql
+# migrations already use, so create_all and Alembic autogenerate agree with
+# the live schema instead of adding unnamed duplicates. Foreign keys in those
+# migrations don't follow one pattern (fk_reviews_restaurant,
+# fk_photos_uploaded_by_user, ...), so each ForeignKey carries its SQL name.
+NAMING_CONVENTION = {
+    "ix": "idx_%(table_name)s_%(column_0_N_name)s",
+    "uq": "uk_%(table_name)s_%(column_0_N_name)s",
+    "pk": "pk_%(table_name)s",
+}
 
-class Base(DeclarativeBase):
-    pass
 
+class Base(DeclarativeBase):
+    metadata = MetaData(naming_convention=NAMING_CONVENTION)
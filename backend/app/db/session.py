@@ -6,8 +6,21 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import get_settings
 
 settings = get_settings()
-engine = create_engine(settings.database_url, pool_pre_ping=True, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+engine = create_engine(
+    settings.database_url,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    # Recycle before MySQL's wait_timeout drops idle connections server-side.
+    pool_recycle=settings.db_pool_recycle_seconds,
+    # LIFO checkout keeps a small hot set in use at low load; the surplus sits
+    # idle and is reaped by pool_recycle instead of every connection going stale.
+    pool_use_lifo=True,
+    future=True,
+)
+# expire_on_commit=False: objects stay readable after commit without a re-SELECT;
+# call db.refresh() explicitly where server-generated values are needed.
+SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, expire_on_commit=False)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -1,5 +1,6 @@
 import logging
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -22,7 +23,9 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.mount("/uploads", StaticFiles(directory=settings.uploads_dir), name="uploads")
+# Behind a reverse proxy set SERVE_UPLOADS=false and let it serve /uploads/ from disk.
+if settings.serve_uploads:
+    app.mount("/uploads", StaticFiles(directory=settings.uploads_dir), name="uploads")
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 register_exception_handlers(app)
 
@@ -32,6 +35,17 @@ def health_root() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.on_event("startup")
+async def size_threadpool_to_db_pool() -> None:
+    # Sync endpoints run in AnyIO's threadpool (40 threads by default) and hold
+    # a thread for as long as they hold a pooled connection; size the two alike
+    # so requests queue on the DB pool, not on a smaller thread limit.
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = max(
+        limiter.total_tokens, settings.db_pool_size + settings.db_max_overflow
+    )
+
+
 @app.on_event("startup")
 def ping_database_on_startup() -> None:
     if not settings.startup_db_check_enabled:
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, ForeignKey, UniqueConstraint, func
+from sqlalchemy import BigInteger, ForeignKey, TIMESTAMP, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -23,17 +23,18 @@ class Favorite(Base):
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("users.id", ondelete="CASCADE"),
+        ForeignKey("users.id", ondelete="CASCADE", name="fk_favorites_user"),
         nullable=False,
         index=True,
     )
     restaurant_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        ForeignKey("restaurants.id", ondelete="CASCADE", name="fk_favorites_restaurant"),
         nullable=False,
         index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
         server_default=func.now(),
         nullable=False,
     )
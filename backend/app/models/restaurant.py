@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, DateTime, Float, ForeignKey, JSON, String, Text, text
+from sqlalchemy import BigInteger, TIMESTAMP, Float, ForeignKey, JSON, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -43,21 +43,26 @@ class Restaurant(Base):
     # Ownership
     created_by_user_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
-        ForeignKey("users.id", ondelete="SET NULL"),
+        ForeignKey("users.id", ondelete="SET NULL", name="fk_restaurants_created_by_user"),
         nullable=True,
     )
     claimed_by_owner_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
-        ForeignKey("owners.id", ondelete="SET NULL"),
+        ForeignKey("owners.id", ondelete="SET NULL", name="fk_restaurants_claimed_by_owner"),
         nullable=True,
     )
 
+    # Rating counters, kept current by triggers on reviews
+    # (db/008_restaurant_rating_counters.sql); read through _rating_stats().
+    review_count: Mapped[int] = mapped_column(nullable=False, server_default=text("0"))
+    rating_sum: Mapped[int] = mapped_column(nullable=False, server_default=text("0"))
+
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+        TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        TIMESTAMP,
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
         server_onupdate=text("CURRENT_TIMESTAMP"),
@@ -65,7 +70,10 @@ class Restaurant(Base):
 
     # Relationships (used by joined queries in service layer)
     photos: Mapped[list["RestaurantPhoto"]] = relationship(  # noqa: F821
-        "RestaurantPhoto", back_populates="restaurant", cascade="all, delete-orphan"
+        "RestaurantPhoto",
+        back_populates="restaurant",
+        cascade="all, delete-orphan",
+        order_by="RestaurantPhoto.id",
     )
     # reviews relationship added in Phase 4 once the Review model is defined
 
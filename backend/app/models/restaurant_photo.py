@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, text
+from sqlalchemy import BigInteger, TIMESTAMP, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -21,12 +21,17 @@ if TYPE_CHECKING:
 
 class RestaurantPhoto(Base):
     __tablename__ = "restaurant_photos"
+    __table_args__ = (
+        # Photos are loaded per restaurant in upload order (cover = lowest id);
+        # see db/007_restaurant_photos_index.sql.
+        Index("idx_restaurant_photos_restaurant_id", "restaurant_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     restaurant_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        ForeignKey("restaurants.id", ondelete="CASCADE", name="fk_photos_restaurant"),
         nullable=False,
     )
     photo_url: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -34,20 +39,22 @@ class RestaurantPhoto(Base):
     # Exactly one of these will be set per row (auth rule from plan section 3.2)
     uploaded_by_user_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
-        ForeignKey("users.id", ondelete="SET NULL"),
+        ForeignKey("users.id", ondelete="SET NULL", name="fk_photos_uploaded_by_user"),
         nullable=True,
     )
     uploaded_by_owner_id: Mapped[Optional[int]] = mapped_column(
         BigInteger,
-        ForeignKey("owners.id", ondelete="SET NULL"),
+        ForeignKey("owners.id", ondelete="SET NULL", name="fk_photos_uploaded_by_owner"),
         nullable=True,
     )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+        TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP")
     )
 
     # Relationships
+    # Photos are only ever loaded through selectinload(Restaurant.photos); walking
+    # back to the parent per photo would be an N+1, so make it fail loudly.
     restaurant: Mapped["Restaurant"] = relationship(
-        "Restaurant", back_populates="photos"
+        "Restaurant", back_populates="photos", lazy="raise"
     )
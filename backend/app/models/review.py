@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Text, text
+from sqlalchemy import BigInteger, CheckConstraint, TIMESTAMP, ForeignKey, Index, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -14,29 +14,36 @@ class Review(Base):
     __tablename__ = "reviews"
     __table_args__ = (
         CheckConstraint("rating BETWEEN 1 AND 5", name="chk_reviews_rating"),
+        # Matches the list ordering; see db/005_review_list_index.sql.
+        Index("idx_reviews_restaurant_created", "restaurant_id", "created_at", "id"),
+        # Rating aggregates and the user's review history; see db/006_review_aggregate_indexes.sql.
+        Index("idx_reviews_restaurant_rating", "restaurant_id", "rating"),
+        Index("idx_reviews_user_created", "user_id", "created_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
 
     restaurant_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("restaurants.id", ondelete="CASCADE"),
+        ForeignKey("restaurants.id", ondelete="CASCADE", name="fk_reviews_restaurant"),
         nullable=False,
     )
     user_id: Mapped[int] = mapped_column(
         BigInteger,
-        ForeignKey("users.id", ondelete="CASCADE"),
+        ForeignKey("users.id", ondelete="CASCADE", name="fk_reviews_user"),
         nullable=False,
     )
 
     rating: Mapped[int] = mapped_column(nullable=False)
     comment: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # TIMESTAMP (4 bytes) like the db/*.sql schema; MySQL caps it at
+    # 2038-01-19, after which these columns need DATETIME or epoch BIGINT.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, server_default=text("CURRENT_TIMESTAMP")
+        TIMESTAMP, nullable=False, server_default=text("CURRENT_TIMESTAMP")
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        TIMESTAMP,
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
         server_onupdate=text("CURRENT_TIMESTAMP"),
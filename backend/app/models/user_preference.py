@@ -1,11 +1,18 @@
+from __future__ import annotations
+
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, JSON, text
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, TIMESTAMP, Enum, ForeignKey, JSON, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
+if TYPE_CHECKING:
+    from app.models.user import User
+
+# MySQL stores ENUM values as a 1-byte index into the type's value list, so
+# these are already as narrow as a TINYINT code; keep the readable tokens.
 price_range_enum = Enum("$", "$$", "$$$", "$$$$", name="price_range_enum")
 sort_preference_enum = Enum(
     "rating",
@@ -19,8 +26,12 @@ sort_preference_enum = Enum(
 class UserPreference(Base):
     __tablename__ = "user_preferences"
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), unique=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE", name="fk_user_preferences_user"),
+        unique=True,
+    )
     cuisines: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
     price_range: Mapped[Optional[str]] = mapped_column(price_range_enum, nullable=True)
     preferred_locations: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
@@ -33,8 +44,13 @@ class UserPreference(Base):
         server_default=text("'rating'"),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        TIMESTAMP,
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
         server_onupdate=text("CURRENT_TIMESTAMP"),
     )
+
+    # Relationships
+    user: Mapped[User] = relationship(
+        "User", back_populates="preferences"
+    )
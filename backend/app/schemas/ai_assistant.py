@@ -1,8 +1,15 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Bound on how much history a request may make us validate; older turns are
+# dropped unvalidated. The LLM prompts only use the last 6-8 turns, but the
+# follow-up handling scans back for the latest assistant and user turns, so
+# the window leaves room for a run of user messages since the last
+# ranked-list reply.
+MAX_HISTORY_TURNS = 32
 
 
 class ConversationTurn(BaseModel):
@@ -14,8 +21,17 @@ class AIChatRequest(BaseModel):
     message: str = Field(min_length=1, max_length=3000)
     conversation_history: list[ConversationTurn] = Field(default_factory=list)
 
+    @field_validator("conversation_history", mode="before")
+    @classmethod
+    def keep_recent_turns(cls, value: Any) -> Any:
+        if isinstance(value, list) and len(value) > MAX_HISTORY_TURNS:
+            return value[-MAX_HISTORY_TURNS:]
+        return value
+
 
 class SuggestedRestaurant(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     reason: str
@@ -1,21 +1,28 @@
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+# Normalized by pydantic-core while parsing, so handlers receive it ready for lookup.
+NormalizedEmail = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_lower=True, min_length=5, max_length=255)
+]
 
 
 class SignupRequest(BaseModel):
     name: str = Field(min_length=1, max_length=100)
-    email: str = Field(min_length=5, max_length=255)
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=72)
 
 
 class OwnerSignupRequest(BaseModel):
     name: str = Field(min_length=1, max_length=100)
-    email: str = Field(min_length=5, max_length=255)
+    email: NormalizedEmail
     password: str = Field(min_length=8, max_length=72)
     restaurant_location: str = Field(min_length=1, max_length=255)
 
 
 class LoginRequest(BaseModel):
-    email: str = Field(min_length=5, max_length=255)
+    email: NormalizedEmail
     password: str = Field(min_length=1, max_length=72)
 
 
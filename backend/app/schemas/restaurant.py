@@ -16,7 +16,7 @@ PricingTier = Literal["$", "$$", "$$$", "$$$$"]
 # ---------------------------------------------------------------------------
 
 class PhotoResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     photo_url: str
@@ -25,6 +25,15 @@ class PhotoResponse(BaseModel):
     created_at: datetime
 
 
+class UploadedPhoto(BaseModel):
+    id: int
+    photo_url: str
+
+
+class PhotoUploadResponse(BaseModel):
+    photos: list[UploadedPhoto]
+
+
 # ---------------------------------------------------------------------------
 # Create
 # ---------------------------------------------------------------------------
@@ -102,7 +111,7 @@ class RestaurantResponse(BaseModel):
 
 class RestaurantCard(BaseModel):
     """Shape returned in search results list."""
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     name: str
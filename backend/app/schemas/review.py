@@ -18,7 +18,7 @@ class ReviewUpdate(BaseModel):
 
 
 class ReviewResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: int
     restaurant_id: int
@@ -28,3 +28,10 @@ class ReviewResponse(BaseModel):
     user_name: str
     created_at: datetime
     updated_at: datetime
+
+
+class ReviewListResponse(BaseModel):
+    items: list[ReviewResponse]
+    total: int
+    page: int
+    limit: int
@@ -1,21 +1,67 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
 import json
 import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from cachetools import TTLCache
+from pydantic import TypeAdapter
 from sqlalchemy import String, cast, or_, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.models.restaurant import Restaurant
 from app.models.user_preference import UserPreference
 from app.schemas.ai_assistant import AIChatResponse, ConversationTurn, SuggestedRestaurant
 from app.services.errors import ServiceBadRequest
-from app.services.restaurant_service import _fetch_ratings
+from app.services.restaurant_service import _rating_stats
 
 settings = get_settings()
 
+# Built once; serializes the SSE suggestions payload straight to JSON in pydantic-core.
+_SUGGESTIONS_ADAPTER = TypeAdapter(list[SuggestedRestaurant])
+# Dumps the recent history for the reply prompt in one pydantic-core call.
+_TURNS_ADAPTER = TypeAdapter(list[ConversationTurn])
+
+# Restaurant-name dictionary for _extract_mentioned_restaurant_names, stored as
+# (lowered, original) pairs so follow-up turns skip the 500-row SELECT and the
+# per-name .lower(). Single entry; the TTL bounds how long a new or renamed
+# restaurant goes unrecognised in assistant replies.
+_NAME_DICTIONARY_CACHE: TTLCache = TTLCache(maxsize=1, ttl=60)
+_NAME_DICTIONARY_CACHE_LOCK = threading.Lock()
+
+# Tavily: one client per process (reuses its HTTP connection), results cached
+# per query for a few hours, and the per-suggestion searches run in parallel.
+_tavily_client: Any = None
+_TAVILY_LOCK = threading.Lock()
+_TAVILY_RESULT_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=6 * 60 * 60)
+_TAVILY_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="tavily")
+
+# Parsed LLM intents keyed by a digest of the full extraction prompt (message,
+# last 6 turns, preferences), so retries and duplicate submits skip the call.
+_LLM_INTENT_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=10 * 60)
+_LLM_INTENT_CACHE_LOCK = threading.Lock()
+
+# Static parts of the LLM intent-extraction prompt; only the three slots
+# are filled per call.
+_INTENT_SYSTEM_PROMPT = "You parse restaurant recommendation intent. Output valid JSON only."
+_INTENT_PROMPT_TEMPLATE = (
+    "Extract restaurant search intent from the user message and conversation.\n"
+    "Return JSON only with keys:\n"
+    'cuisines (array), price_range (one of "$","$$","$$$","$$$$" or null),\n'
+    "location (string or null), dietary_needs (array), ambiance (array),\n"
+    "keywords (array), occasion (string or null).\n\n"
+    "User preferences: {preferences}\n"
+    "Conversation history:\n{history}\n"
+    "User message: {message}\n"
+)
+
 _PRICE_SET = {"$", "$$", "$$$", "$$$$"}
 _DEFAULT_CUISINES = {
     "american",
@@ -132,12 +178,115 @@ _ORDINAL_HINTS = {
 _NEW_SEARCH_HINTS = {"recommend", "suggest", "find", "show", "search", "looking for", "i want"}
 
 
+def _substring_alternation(tokens: set[str] | dict[str, int]) -> re.Pattern[str]:
+    """One compiled pattern equivalent to `any(token in text for token in tokens)`."""
+    return re.compile("|".join(re.escape(token) for token in sorted(tokens, key=len, reverse=True)))
+
+
+# Precompiled token-set scans for the follow-up path; plain substring
+# alternations (no word boundaries) so they match exactly what the sets did.
+_FOLLOWUP_REGEXES: list[tuple[str, re.Pattern[str]]] = [
+    (topic, _substring_alternation(tokens)) for topic, tokens in _FOLLOWUP_TOPIC_ORDER
+]
+_PRONOUN_RE = _substring_alternation(_PRONOUN_FOLLOWUP_TOKENS)
+_ORDINAL_RE = _substring_alternation(_ORDINAL_HINTS)
+_NEW_SEARCH_RE = _substring_alternation(_NEW_SEARCH_HINTS)
+# "1. Name (4.5 stars)" / "2. Name - reason" lines of a ranked assistant reply.
+_RANKED_LINE_RE = re.compile(r"^\s*\d+\.\s*([^\(\n\-]+?)(?:\s*\(|\s*-|$)", re.MULTILINE)
+# Outermost {...} span of an LLM reply that wraps its JSON in prose or fences.
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+
+_VocabMatcher = tuple[re.Pattern[str], dict[str, tuple[str, ...]]]
+
+
+# Memoized: users' preference sets repeat across turns, so each distinct
+# vocabulary is compiled once per process rather than once per message.
+@functools.lru_cache(maxsize=256)
+def _compile_vocab(vocab: frozenset[str]) -> _VocabMatcher:
+    """Compile a vocabulary into one scan that finds every term contained in a text.
+
+    The lookahead alternation (longest term first) reports the longest term
+    starting at each position; `contained` maps each term to the other terms
+    inside it, which are then present too. Together that is exactly
+    `{term for term in vocab if term in text}`.
+    """
+    ordered = sorted(vocab, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(term) for term in ordered) + "))")
+    contained = {
+        term: tuple(other for other in vocab if other != term and other in term)
+        for term in vocab
+    }
+    return pattern, contained
+
+
+def _match_vocab(matcher: _VocabMatcher, lowered: str) -> list[str]:
+    pattern, contained = matcher
+    found: set[str] = set()
+    for term in pattern.findall(lowered):
+        if term not in found:
+            found.add(term)
+            found.update(contained[term])
+    return sorted(found)
+
+
+_CUISINE_VOCAB = _compile_vocab(frozenset(_DEFAULT_CUISINES))
+_DIETARY_VOCAB = _compile_vocab(frozenset(_DEFAULT_DIETARY))
+_AMBIANCE_VOCAB = _compile_vocab(frozenset(_DEFAULT_AMBIANCE))
+
+
+def _vocab_for(
+    extra: list[Any] | None,
+    defaults: set[str],
+    default_matcher: _VocabMatcher,
+) -> _VocabMatcher:
+    """Default matcher unless the user's preferences add terms outside the defaults."""
+    extra_terms = {str(term).lower() for term in extra or () if term} - defaults
+    if not extra_terms:
+        return default_matcher
+    return _compile_vocab(frozenset(extra_terms | defaults))
+
+
 def generate_chat_response(
     db: Session,
     user_id: int,
     message: str,
     conversation_history: list[ConversationTurn],
 ) -> AIChatResponse:
+    prepared = _prepare_chat(db, user_id, message, conversation_history)
+    if isinstance(prepared, AIChatResponse):
+        return prepared
+
+    reply = _build_reply(**prepared)
+    return AIChatResponse(reply=reply, suggested_restaurants=prepared["suggestions"])
+
+
+def stream_chat_response(
+    db: Session,
+    user_id: int,
+    message: str,
+    conversation_history: list[ConversationTurn],
+) -> Iterator[str]:
+    """Run retrieval now and return an iterator of server-sent events for the reply.
+
+    All database work finishes before this returns, so the iterator only talks
+    to the LLM and can be consumed after the request's session is closed.
+    Events: `suggestions` (list of SuggestedRestaurant), one or more `delta`
+    ({"text": ...}), then `done`.
+    """
+    prepared = _prepare_chat(db, user_id, message, conversation_history)
+    if isinstance(prepared, AIChatResponse):
+        return _iter_chat_events(prepared.suggested_restaurants, iter([prepared.reply]))
+    return _iter_chat_events(prepared["suggestions"], _stream_reply(**prepared))
+
+
+def _prepare_chat(
+    db: Session,
+    user_id: int,
+    message: str,
+    conversation_history: list[ConversationTurn],
+) -> AIChatResponse | dict[str, Any]:
+    """Answer follow-ups directly; otherwise return the inputs for `_build_reply`."""
     clean_message = message.strip()
     if not clean_message:
         raise ServiceBadRequest("Message cannot be empty.")
@@ -162,15 +311,32 @@ def generate_chat_response(
         _build_suggestion(item, tavily_context.get(item["restaurant"].id, []))
         for item in top_ranked
     ]
-    reply = _build_reply(
-        message=clean_message,
-        conversation_history=conversation_history,
-        preferences=preferences,
-        intent=intent,
-        suggestions=suggestions,
-        tavily_context=tavily_context,
-    )
-    return AIChatResponse(reply=reply, suggested_restaurants=suggestions)
+    return {
+        "message": clean_message,
+        "conversation_history": conversation_history,
+        "preferences": preferences,
+        "intent": intent,
+        "suggestions": suggestions,
+        "tavily_context": tavily_context,
+    }
+
+
+def _iter_chat_events(
+    suggestions: list[SuggestedRestaurant],
+    reply_chunks: Iterator[str],
+) -> Iterator[str]:
+    yield _sse_frame("suggestions", _SUGGESTIONS_ADAPTER.dump_json(suggestions).decode())
+    for chunk in reply_chunks:
+        yield _sse_event("delta", {"text": chunk})
+    yield _sse_event("done", {})
+
+
+def _sse_event(event: str, data: Any) -> str:
+    return _sse_frame(event, json.dumps(data, ensure_ascii=True))
+
+
+def _sse_frame(event: str, data_json: str) -> str:
+    return f"event: {event}\ndata: {data_json}\n\n"
 
 
 def _handle_attribute_followup(
@@ -179,7 +345,14 @@ def _handle_attribute_followup(
     conversation_history: list[ConversationTurn],
     preferences: dict[str, Any],
 ) -> AIChatResponse | None:
-    followup_type = _detect_followup_type(message)
+    # Lowercased once here; the helpers below all take pre-lowered text.
+    lowered = message.lower()
+    # Checked first: a fresh search never uses the previous turn's names, so
+    # don't pay for resolving them (or re-running the last search) at all.
+    if _looks_like_new_search_request(lowered):
+        return None
+
+    followup_type = _detect_followup_type(lowered)
     ranked_names = _extract_latest_ranked_names(db, conversation_history)
     if not ranked_names:
         ranked_names = _infer_context_names_from_previous_user_query(
@@ -188,9 +361,6 @@ def _handle_attribute_followup(
             preferences=preferences,
         )
 
-    if _looks_like_new_search_request(message):
-        return None
-
     # If user asks a follow-up attribute question but we can't resolve context,
     # ask clarification instead of silently falling back to global re-ranking.
     if followup_type is not None and not ranked_names:
@@ -205,11 +375,12 @@ def _handle_attribute_followup(
     if not ranked_names:
         return None
 
-    has_reference_hint = _has_reference_hint(message, ranked_names)
+    ranked_lower = [name.lower() for name in ranked_names]
+    has_reference_hint = _has_reference_hint(lowered, ranked_lower)
     if followup_type is None and not has_reference_hint:
         return None
 
-    referenced_name = _extract_referenced_restaurant_name(message, ranked_names)
+    referenced_name = _extract_referenced_restaurant_name(lowered, ranked_names, ranked_lower)
     if not referenced_name and followup_type is not None and len(ranked_names) == 1:
         referenced_name = ranked_names[0]
     if not referenced_name:
@@ -219,8 +390,9 @@ def _handle_attribute_followup(
 
     restaurant = db.execute(
         select(Restaurant)
-        .options(selectinload(Restaurant.photos))
-        .where(Restaurant.name.ilike(referenced_name.strip()))
+        # Plain equality: the column's _ci collation already ignores case, and
+        # unlike ILIKE (lower(name) LIKE ...) it can use idx_restaurants_name.
+        .where(Restaurant.name == referenced_name.strip())
         .limit(1)
     ).scalar_one_or_none()
     if restaurant is None:
@@ -228,7 +400,7 @@ def _handle_attribute_followup(
         suggestions = _build_followup_suggestions(db, ranked_names[:3])
         return AIChatResponse(reply=reply, suggested_restaurants=suggestions)
 
-    avg_rating, review_count = _fetch_ratings(db, [restaurant.id]).get(restaurant.id, (0.0, 0))
+    avg_rating, review_count = _rating_stats(restaurant)
     if followup_type is None:
         followup_type = "summary"
     reply, reason = _build_attribute_followup_reply(
@@ -250,10 +422,9 @@ def _handle_attribute_followup(
     return AIChatResponse(reply=reply, suggested_restaurants=[suggestion])
 
 
-def _detect_followup_type(message: str) -> str | None:
-    lowered = message.lower()
-    for topic, tokens in _FOLLOWUP_TOPIC_ORDER:
-        if any(token in lowered for token in tokens):
+def _detect_followup_type(lowered: str) -> str | None:
+    for topic, pattern in _FOLLOWUP_REGEXES:
+        if pattern.search(lowered):
             return topic
     return None
 
@@ -384,23 +555,50 @@ def _build_summary_followup_reply(restaurant: Restaurant) -> str:
     )
 
 
-def _fetch_tavily_hours_hint(restaurant: Restaurant) -> str | None:
+def _get_tavily_client() -> Any | None:
+    global _tavily_client
     if not settings.tavily_api_key:
         return None
+    with _TAVILY_LOCK:
+        if _tavily_client is None:
+            try:
+                from tavily import TavilyClient
+            except Exception:
+                return None
+            _tavily_client = TavilyClient(api_key=settings.tavily_api_key)
+        return _tavily_client
+
+
+def _tavily_search(query: str, max_results: int) -> list[Any] | None:
+    """Cached Tavily search rows; None when Tavily is unavailable or the call fails."""
+    cache_key = (query, max_results)
+    with _TAVILY_LOCK:
+        cached = _TAVILY_RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = _get_tavily_client()
+    if client is None:
+        return None
     try:
-        from tavily import TavilyClient
+        result = client.search(query=query, max_results=max_results, search_depth="basic")
     except Exception:
         return None
 
-    client = TavilyClient(api_key=settings.tavily_api_key)
+    rows = list((result or {}).get("results") or [])
+    with _TAVILY_LOCK:
+        _TAVILY_RESULT_CACHE[cache_key] = rows
+    return rows
+
+
+def _fetch_tavily_hours_hint(restaurant: Restaurant) -> str | None:
     city_hint = restaurant.city or ""
     query = f"{restaurant.name} {city_hint} opening hours"
-    try:
-        result = client.search(query=query, max_results=1, search_depth="basic")
-    except Exception:
+    rows = _tavily_search(query, max_results=1)
+    if not rows:
         return None
 
-    row = ((result or {}).get("results") or [None])[0]
+    row = rows[0]
     if not isinstance(row, dict):
         return None
 
@@ -411,12 +609,12 @@ def _fetch_tavily_hours_hint(restaurant: Restaurant) -> str | None:
 
 
 def _extract_referenced_restaurant_name(
-    message: str,
+    lowered: str,
     ranked_names: list[str],
+    ranked_lower: list[str],
 ) -> str | None:
-    lowered = message.lower()
-    for name in ranked_names:
-        if name.lower() in lowered:
+    for name, name_lower in zip(ranked_names, ranked_lower):
+        if name_lower in lowered:
             return name
 
     for token, index in _ORDINAL_HINTS.items():
@@ -428,7 +626,7 @@ def _extract_referenced_restaurant_name(
     if ("top" in lowered or "best" in lowered) and ranked_names:
         return ranked_names[0]
 
-    if any(token in lowered for token in _PRONOUN_FOLLOWUP_TOKENS):
+    if _PRONOUN_RE.search(lowered):
         return ranked_names[0]
     return None
 
@@ -473,7 +671,7 @@ def _infer_context_names_from_previous_user_query(
     if not has_structured_filters:
         return []
 
-    ranked = _search_and_rank_restaurants(db, intent, preferences)
+    ranked = _search_and_rank_restaurants(db, intent, preferences, limit=3)
     names: list[str] = []
     for row in ranked[:3]:
         restaurant = row.get("restaurant")
@@ -482,29 +680,43 @@ def _infer_context_names_from_previous_user_query(
     return names
 
 
-def _extract_mentioned_restaurant_names(db: Session, text: str, max_names: int = 5) -> list[str]:
-    lowered = text.lower()
-    if not lowered.strip():
-        return []
+def _restaurant_name_dictionary(db: Session) -> tuple[tuple[str, int, str], ...]:
+    """(lowered name, -len(name), name) per restaurant, precomputed for the scan below."""
+    with _NAME_DICTIONARY_CACHE_LOCK:
+        cached = _NAME_DICTIONARY_CACHE.get("names")
+    if cached is not None:
+        return cached
 
     names = db.execute(
         select(Restaurant.name).where(Restaurant.name.is_not(None)).limit(500)
     ).scalars().all()
-    matches: list[tuple[int, int, str]] = []
+    entries: list[tuple[str, int, str]] = []
     for raw_name in names:
         name = str(raw_name or "").strip()
-        if not name:
-            continue
-        idx = lowered.find(name.lower())
-        if idx >= 0:
-            matches.append((idx, -len(name), name))
+        if name:
+            entries.append((name.lower(), -len(name), name))
+    dictionary = tuple(entries)
+    with _NAME_DICTIONARY_CACHE_LOCK:
+        _NAME_DICTIONARY_CACHE["names"] = dictionary
+    return dictionary
+
+
+def _extract_mentioned_restaurant_names(db: Session, text: str, max_names: int = 5) -> list[str]:
+    lowered = text.lower()
+    if not lowered.strip():
+        return []
+
+    matches = [
+        (idx, neg_len, name, lowered_name)
+        for lowered_name, neg_len, name in _restaurant_name_dictionary(db)
+        if (idx := lowered.find(lowered_name)) >= 0
+    ]
     if not matches:
         return []
     matches.sort()
     deduped: list[str] = []
     seen: set[str] = set()
-    for _, _, name in matches:
-        key = name.lower()
+    for _, _, name, key in matches:
         if key in seen:
             continue
         seen.add(key)
@@ -514,23 +726,17 @@ def _extract_mentioned_restaurant_names(db: Session, text: str, max_names: int =
     return deduped
 
 
-def _has_reference_hint(message: str, ranked_names: list[str]) -> bool:
-    lowered = message.lower()
-    if any(name.lower() in lowered for name in ranked_names):
+def _has_reference_hint(lowered: str, ranked_lower: list[str]) -> bool:
+    if any(name_lower in lowered for name_lower in ranked_lower):
         return True
-    if any(token in lowered for token in _PRONOUN_FOLLOWUP_TOKENS):
-        return True
-    if any(token in lowered for token in _ORDINAL_HINTS):
+    if _PRONOUN_RE.search(lowered) or _ORDINAL_RE.search(lowered):
         return True
     return "last one" in lowered or "that one" in lowered or "this one" in lowered
 
 
-def _looks_like_new_search_request(message: str) -> bool:
-    lowered = message.lower()
-    has_search_verb = any(token in lowered for token in _NEW_SEARCH_HINTS)
-    has_reference = any(token in lowered for token in _PRONOUN_FOLLOWUP_TOKENS) or any(
-        token in lowered for token in _ORDINAL_HINTS
-    )
+def _looks_like_new_search_request(lowered: str) -> bool:
+    has_search_verb = _NEW_SEARCH_RE.search(lowered) is not None
+    has_reference = _PRONOUN_RE.search(lowered) or _ORDINAL_RE.search(lowered)
     return has_search_verb and not has_reference
 
 
@@ -552,8 +758,7 @@ def _build_followup_suggestions(db: Session, ranked_names: list[str]) -> list[Su
         return []
     restaurants = db.execute(
         select(Restaurant)
-        .options(selectinload(Restaurant.photos))
-        .where(or_(*[Restaurant.name.ilike(name) for name in ranked_names[:3]]))
+        .where(Restaurant.name.in_(ranked_names[:3]))
         .limit(10)
     ).scalars().all()
     if not restaurants:
@@ -569,13 +774,12 @@ def _build_followup_suggestions(db: Session, ranked_names: list[str]) -> list[Su
     if not ordered:
         ordered = restaurants[:3]
 
-    ratings = _fetch_ratings(db, [r.id for r in ordered])
     return [
         SuggestedRestaurant(
             id=r.id,
             name=r.name,
             reason="From your recent recommendation list",
-            average_rating=ratings.get(r.id, (0.0, 0))[0],
+            average_rating=_rating_stats(r)[0],
             pricing_tier=r.pricing_tier,
             cuisine_type=r.cuisine_type,
             city=r.city,
@@ -585,12 +789,8 @@ def _build_followup_suggestions(db: Session, ranked_names: list[str]) -> list[Su
 
 
 def _extract_ranked_names(text: str) -> list[str]:
-    names: list[str] = []
-    for match in re.finditer(r"(?m)^\s*\d+\.\s*([^\(\n\-]+?)(?:\s*\(|\s*-|$)", text):
-        name = match.group(1).strip()
-        if name:
-            names.append(name)
-    return names
+    names = (match.strip() for match in _RANKED_LINE_RE.findall(text))
+    return [name for name in names if name]
 
 
 def _load_user_preferences(db: Session, user_id: int) -> dict[str, Any]:
@@ -673,55 +873,56 @@ def _extract_intent_with_llm(
     conversation_history: list[ConversationTurn],
     preferences: dict[str, Any],
 ) -> dict[str, Any] | None:
-    client = _build_llm_client(temperature=0.1)
-    if client is None:
-        return None
-
     history_blob = "\n".join(
         f"{turn.role}: {turn.content}" for turn in conversation_history[-6:]
     )
-    prompt = (
-        "Extract restaurant search intent from the user message and conversation.\n"
-        "Return JSON only with keys:\n"
-        'cuisines (array), price_range (one of "$","$$","$$$","$$$$" or null),\n'
-        "location (string or null), dietary_needs (array), ambiance (array),\n"
-        "keywords (array), occasion (string or null).\n\n"
-        f"User preferences: {json.dumps(preferences, ensure_ascii=True)}\n"
-        f"Conversation history:\n{history_blob or '(none)'}\n"
-        f"User message: {message}\n"
+    prompt = _INTENT_PROMPT_TEMPLATE.format(
+        preferences=json.dumps(preferences, ensure_ascii=True),
+        history=history_blob or "(none)",
+        message=message,
     )
+    cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+    with _LLM_INTENT_CACHE_LOCK:
+        cached = _LLM_INTENT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    client = _build_llm_client(temperature=0.1)
+    if client is None:
+        return None
 
     try:
         from langchain_core.messages import HumanMessage, SystemMessage
 
         response = client.invoke(
             [
-                SystemMessage(
-                    content=(
-                        "You parse restaurant recommendation intent. "
-                        "Output valid JSON only."
-                    )
-                ),
+                SystemMessage(content=_INTENT_SYSTEM_PROMPT),
                 HumanMessage(content=prompt),
             ]
         )
         payload = _extract_json_object(_message_content_to_text(response.content))
         if payload is None:
             return None
-        return _normalize_intent(payload)
+        intent = _normalize_intent(payload)
     except Exception:
         return None
 
+    with _LLM_INTENT_CACHE_LOCK:
+        _LLM_INTENT_CACHE[cache_key] = intent
+    return intent
+
 
 def _extract_intent_heuristic(message: str, preferences: dict[str, Any]) -> dict[str, Any]:
     lowered = message.lower()
-    cuisine_vocab = {c.lower() for c in preferences.get("cuisines", []) if c} | _DEFAULT_CUISINES
-    dietary_vocab = {d.lower() for d in preferences.get("dietary_needs", []) if d} | _DEFAULT_DIETARY
-    ambiance_vocab = {a.lower() for a in preferences.get("ambiance", []) if a} | _DEFAULT_AMBIANCE
-
-    cuisines = [c for c in sorted(cuisine_vocab) if c in lowered]
-    dietary = [d for d in sorted(dietary_vocab) if d in lowered]
-    ambiance = [a for a in sorted(ambiance_vocab) if a in lowered]
+    cuisines = _match_vocab(
+        _vocab_for(preferences.get("cuisines"), _DEFAULT_CUISINES, _CUISINE_VOCAB), lowered
+    )
+    dietary = _match_vocab(
+        _vocab_for(preferences.get("dietary_needs"), _DEFAULT_DIETARY, _DIETARY_VOCAB), lowered
+    )
+    ambiance = _match_vocab(
+        _vocab_for(preferences.get("ambiance"), _DEFAULT_AMBIANCE, _AMBIANCE_VOCAB), lowered
+    )
 
     price_match = re.search(r"\${1,4}", message)
     price_range = price_match.group(0) if price_match and price_match.group(0) in _PRICE_SET else None
@@ -777,18 +978,26 @@ def _search_and_rank_restaurants(
     db: Session,
     intent: dict[str, Any],
     preferences: dict[str, Any],
+    limit: int = 5,
 ) -> list[dict[str, Any]]:
-    stmt = select(Restaurant).options(selectinload(Restaurant.photos))
+    """Top `limit` candidates for the intent, best first (callers never use more)."""
+    # No photo eager-load anywhere in the assistant: suggestions and replies
+    # never read photos, and selectinload would cost a second round trip.
+    stmt = select(Restaurant)
     cuisines = intent.get("cuisines") or []
     location = intent.get("location")
     keywords = intent.get("keywords") or []
 
+    # LIKE, not ILIKE, on the text columns: their utf8mb4_unicode_ci collation
+    # already matches case-insensitively, and ILIKE would wrap every column in
+    # LOWER() for every row scanned. The amenities JSON cast is a binary
+    # string, so that leg stays ILIKE.
     if cuisines:
         stmt = stmt.where(
-            or_(*[Restaurant.cuisine_type.ilike(f"%{cuisine}%") for cuisine in cuisines])
+            or_(*[Restaurant.cuisine_type.like(f"%{cuisine}%") for cuisine in cuisines])
         )
     if location:
-        stmt = stmt.where(Restaurant.city.ilike(f"%{location}%"))
+        stmt = stmt.where(Restaurant.city.like(f"%{location}%"))
     # Only apply free-text keyword filtering when no structured filters were given.
     # If user already specified cuisine/location, keyword filter can over-constrain
     # the query (e.g. "recommend chinese restaurant") and cause false empty sets.
@@ -796,9 +1005,9 @@ def _search_and_rank_restaurants(
         keyword_clauses = []
         for kw in keywords[:4]:
             pattern = f"%{kw}%"
-            keyword_clauses.append(Restaurant.name.ilike(pattern))
-            keyword_clauses.append(Restaurant.cuisine_type.ilike(pattern))
-            keyword_clauses.append(Restaurant.description.ilike(pattern))
+            keyword_clauses.append(Restaurant.name.like(pattern))
+            keyword_clauses.append(Restaurant.cuisine_type.like(pattern))
+            keyword_clauses.append(Restaurant.description.like(pattern))
             keyword_clauses.append(cast(Restaurant.amenities, String).ilike(pattern))
         stmt = stmt.where(or_(*keyword_clauses))
 
@@ -808,21 +1017,20 @@ def _search_and_rank_restaurants(
         return []
     if not restaurants:
         restaurants = db.execute(
-            select(Restaurant).options(selectinload(Restaurant.photos)).limit(60)
+            select(Restaurant).limit(60)
         ).scalars().all()
     if not restaurants:
         return []
 
-    ratings = _fetch_ratings(db, [r.id for r in restaurants])
+    terms = _scoring_terms(intent, preferences)
     ranked: list[dict[str, Any]] = []
     for restaurant in restaurants:
-        avg_rating, review_count = ratings.get(restaurant.id, (0.0, 0))
+        avg_rating, review_count = _rating_stats(restaurant)
         score, reasons = _score_restaurant(
             restaurant=restaurant,
             average_rating=avg_rating,
             review_count=review_count,
-            intent=intent,
-            preferences=preferences,
+            terms=terms,
         )
         ranked.append(
             {
@@ -834,11 +1042,52 @@ def _search_and_rank_restaurants(
             }
         )
 
-    ranked.sort(
+    # nlargest is the stable sorted(..., reverse=True)[:limit] without the full sort.
+    return heapq.nlargest(
+        limit,
+        ranked,
         key=lambda row: (row["score"], row["average_rating"], row["review_count"]),
-        reverse=True,
     )
-    return ranked
+
+
+def _unique_terms(terms: list[str]) -> list[str]:
+    return [term for term in dict.fromkeys(terms) if term]
+
+
+def _scoring_terms(intent: dict[str, Any], preferences: dict[str, Any]) -> dict[str, Any]:
+    """Case-folded intent/preference terms, built once per search instead of once per row.
+
+    casefold() rather than lower() on both sides of every comparison, so
+    non-ASCII names and cities (e.g. "Straße" vs "STRASSE") still match.
+    """
+    location = intent.get("location")
+    occasion = intent.get("occasion")
+    terms: dict[str, Any] = {
+        "wanted_cuisines": [c.casefold() for c in (intent.get("cuisines") or [])],
+        "pref_cuisines": [str(c).casefold() for c in (preferences.get("cuisines") or [])],
+        "wanted_price": intent.get("price_range"),
+        "pref_price": preferences.get("price_range"),
+        "location": location.casefold() if location else None,
+        "pref_locations": [
+            loc.casefold() for loc in preferences.get("preferred_locations", []) if loc
+        ],
+        # Scoring stops at the first dietary/ambiance hit, so drop empty and
+        # repeated terms (intent and preferences often overlap) up front.
+        "dietary": _unique_terms(
+            [d.casefold() for d in (intent.get("dietary_needs") or [])]
+            + [str(d).casefold() for d in (preferences.get("dietary_needs") or [])]
+        ),
+        "ambiance": _unique_terms(
+            [a.casefold() for a in (intent.get("ambiance") or [])]
+            + [str(a).casefold() for a in (preferences.get("ambiance") or [])]
+        ),
+        "keywords": [kw.casefold() for kw in (intent.get("keywords") or [])[:4] if kw],
+        "occasion": str(occasion).casefold() if occasion else None,
+    }
+    terms["uses_text"] = bool(
+        terms["dietary"] or terms["ambiance"] or terms["keywords"] or terms["occasion"]
+    )
+    return terms
 
 
 def _score_restaurant(
@@ -846,24 +1095,27 @@ def _score_restaurant(
     restaurant: Restaurant,
     average_rating: float,
     review_count: int,
-    intent: dict[str, Any],
-    preferences: dict[str, Any],
+    terms: dict[str, Any],
 ) -> tuple[float, list[str]]:
     score = average_rating * 0.9 + min(review_count, 40) * 0.05
     reasons: list[str] = []
 
-    text_blob = " ".join(
-        [
-            restaurant.name or "",
-            restaurant.cuisine_type or "",
-            restaurant.description or "",
-            " ".join(str(v) for v in (restaurant.amenities or [])),
-        ]
-    ).lower()
-
-    wanted_cuisines = [c.lower() for c in (intent.get("cuisines") or [])]
-    pref_cuisines = [str(c).lower() for c in (preferences.get("cuisines") or [])]
-    restaurant_cuisine = (restaurant.cuisine_type or "").lower()
+    # Only the dietary/ambiance/keyword/occasion checks read the blob; skip
+    # building it for searches that have none of those terms.
+    text_blob = ""
+    if terms["uses_text"]:
+        text_blob = " ".join(
+            (
+                restaurant.name or "",
+                restaurant.cuisine_type or "",
+                restaurant.description or "",
+                " ".join(str(v) for v in (restaurant.amenities or [])),
+            )
+        ).casefold()
+
+    wanted_cuisines = terms["wanted_cuisines"]
+    pref_cuisines = terms["pref_cuisines"]
+    restaurant_cuisine = (restaurant.cuisine_type or "").casefold()
 
     if wanted_cuisines and any(c in restaurant_cuisine for c in wanted_cuisines):
         score += 4
@@ -872,8 +1124,8 @@ def _score_restaurant(
         score += 2
         reasons.append("Matches your saved cuisine preferences")
 
-    wanted_price = intent.get("price_range")
-    pref_price = preferences.get("price_range")
+    wanted_price = terms["wanted_price"]
+    pref_price = terms["pref_price"]
     if wanted_price and restaurant.pricing_tier == wanted_price:
         score += 2.5
         reasons.append(f"Within your requested budget ({wanted_price})")
@@ -881,38 +1133,35 @@ def _score_restaurant(
         score += 1.5
         reasons.append(f"Matches your usual budget ({pref_price})")
 
-    location = intent.get("location")
-    if location and location.lower() in (restaurant.city or "").lower():
+    city = (restaurant.city or "").casefold()
+    location = terms["location"]
+    if location and location in city:
         score += 2
         reasons.append(f"In your requested area ({restaurant.city})")
     else:
-        for pref_location in preferences.get("preferred_locations", []):
-            if pref_location and pref_location.lower() in (restaurant.city or "").lower():
+        for pref_location in terms["pref_locations"]:
+            if pref_location in city:
                 score += 1.2
                 reasons.append(f"In your preferred location ({restaurant.city})")
                 break
 
-    wanted_dietary = [d.lower() for d in (intent.get("dietary_needs") or [])]
-    pref_dietary = [str(d).lower() for d in (preferences.get("dietary_needs") or [])]
-    for token in wanted_dietary + pref_dietary:
+    for token in terms["dietary"]:
         if token and token in text_blob:
             score += 1
             reasons.append(f"Supports {token} options")
             break
 
-    wanted_ambiance = [a.lower() for a in (intent.get("ambiance") or [])]
-    pref_ambiance = [str(a).lower() for a in (preferences.get("ambiance") or [])]
-    for token in wanted_ambiance + pref_ambiance:
+    for token in terms["ambiance"]:
         if token and token in text_blob:
             score += 0.8
             reasons.append(f"Fits {token} ambiance")
             break
 
-    for kw in (intent.get("keywords") or [])[:4]:
-        if kw and kw.lower() in text_blob:
+    for kw in terms["keywords"]:
+        if kw in text_blob:
             score += 0.6
 
-    occasion = intent.get("occasion")
+    occasion = terms["occasion"]
     if occasion and occasion in text_blob:
         score += 0.6
 
@@ -926,26 +1175,23 @@ def _fetch_tavily_context(
     ranked: list[dict[str, Any]],
     intent: dict[str, Any],
 ) -> dict[int, list[str]]:
-    if not settings.tavily_api_key:
-        return {}
-    try:
-        from tavily import TavilyClient
-    except Exception:
+    if _get_tavily_client() is None:
         return {}
 
-    client = TavilyClient(api_key=settings.tavily_api_key)
+    restaurants: list[Restaurant] = [item["restaurant"] for item in ranked[:3]]
+    queries = [
+        f"{r.name} {r.city or intent.get('location') or ''} restaurant hours special events"
+        for r in restaurants
+    ]
+    results = _TAVILY_EXECUTOR.map(lambda query: _tavily_search(query, max_results=2), queries)
+
     context: dict[int, list[str]] = {}
-    for item in ranked[:3]:
-        restaurant: Restaurant = item["restaurant"]
-        city_hint = restaurant.city or intent.get("location") or ""
-        query = f"{restaurant.name} {city_hint} restaurant hours special events"
-        try:
-            result = client.search(query=query, max_results=2, search_depth="basic")
-        except Exception:
+    for restaurant, rows in zip(restaurants, results):
+        if rows is None:
             continue
 
         snippets: list[str] = []
-        for row in (result or {}).get("results", [])[:2]:
+        for row in rows[:2]:
             title = str(row.get("title", "")).strip()
             content = str(row.get("content", "")).strip()
             merged = f"{title}: {content}".strip(": ").strip()
@@ -1009,35 +1255,16 @@ def _build_reply_with_llm(
     if client is None:
         return None
 
-    suggestion_payload = [s.model_dump() for s in suggestions]
-    context_payload = {
-        "user_preferences": preferences,
-        "query_intent": intent,
-        "suggested_restaurants": suggestion_payload,
-        "tavily_context": tavily_context,
-        "conversation_history": [turn.model_dump() for turn in conversation_history[-8:]],
-        "new_message": message,
-    }
-
     try:
-        from langchain_core.messages import HumanMessage, SystemMessage
-
         response = client.invoke(
-            [
-                SystemMessage(
-                    content=(
-                        "You are a restaurant recommendation assistant. "
-                        "Use provided preferences, ranked restaurants, and Tavily context. "
-                        "Be concise, conversational, and practical."
-                    )
-                ),
-                HumanMessage(
-                    content=(
-                        "Generate a helpful response with 2-4 recommendations and short reasons.\n"
-                        f"{json.dumps(context_payload, ensure_ascii=True)}"
-                    )
-                ),
-            ]
+            _build_reply_messages(
+                message=message,
+                conversation_history=conversation_history,
+                preferences=preferences,
+                intent=intent,
+                suggestions=suggestions,
+                tavily_context=tavily_context,
+            )
         )
         text = _message_content_to_text(response.content).strip()
         return text or None
@@ -1045,6 +1272,78 @@ def _build_reply_with_llm(
         return None
 
 
+def _stream_reply(
+    *,
+    message: str,
+    conversation_history: list[ConversationTurn],
+    preferences: dict[str, Any],
+    intent: dict[str, Any],
+    suggestions: list[SuggestedRestaurant],
+    tavily_context: dict[int, list[str]],
+) -> Iterator[str]:
+    """Yield LLM reply deltas, or the fallback reply if the LLM is unavailable."""
+    client = _build_llm_client(temperature=0.35)
+    streamed_any = False
+    if client is not None:
+        try:
+            for chunk in client.stream(
+                _build_reply_messages(
+                    message=message,
+                    conversation_history=conversation_history,
+                    preferences=preferences,
+                    intent=intent,
+                    suggestions=suggestions,
+                    tavily_context=tavily_context,
+                )
+            ):
+                text = _message_content_to_text(chunk.content)
+                if text:
+                    streamed_any = True
+                    yield text
+        except Exception:
+            # A stream that already produced text can't be retracted; stop there.
+            if streamed_any:
+                return
+    if not streamed_any:
+        yield _build_fallback_reply(suggestions)
+
+
+def _build_reply_messages(
+    *,
+    message: str,
+    conversation_history: list[ConversationTurn],
+    preferences: dict[str, Any],
+    intent: dict[str, Any],
+    suggestions: list[SuggestedRestaurant],
+    tavily_context: dict[int, list[str]],
+) -> list[Any]:
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    context_payload = {
+        "user_preferences": preferences,
+        "query_intent": intent,
+        "suggested_restaurants": _SUGGESTIONS_ADAPTER.dump_python(suggestions),
+        "tavily_context": tavily_context,
+        "conversation_history": _TURNS_ADAPTER.dump_python(conversation_history[-8:]),
+        "new_message": message,
+    }
+    return [
+        SystemMessage(
+            content=(
+                "You are a restaurant recommendation assistant. "
+                "Use provided preferences, ranked restaurants, and Tavily context. "
+                "Be concise, conversational, and practical."
+            )
+        ),
+        HumanMessage(
+            content=(
+                "Generate a helpful response with 2-4 recommendations and short reasons.\n"
+                f"{json.dumps(context_payload, ensure_ascii=True)}"
+            )
+        ),
+    ]
+
+
 def _build_fallback_reply(suggestions: list[SuggestedRestaurant]) -> str:
     if not suggestions:
         return (
@@ -1064,6 +1363,10 @@ def _build_fallback_reply(suggestions: list[SuggestedRestaurant]) -> str:
     return "\n".join(lines)
 
 
+# One client per temperature for the life of the process: the provider and
+# keys come from settings (fixed at startup), and reusing the client keeps
+# its HTTP connection pool warm instead of rebuilding it every turn.
+@functools.lru_cache(maxsize=4)
 def _build_llm_client(temperature: float):
     provider = settings.llm_provider.strip().lower()
     if provider == "anthropic":
@@ -1117,7 +1420,9 @@ def _extract_json_object(raw: str) -> dict[str, Any] | None:
     except json.JSONDecodeError:
         pass
 
-    match = re.search(r"\{.*\}", raw, flags=re.S)
+    if "{" not in raw:
+        return None
+    match = _JSON_OBJECT_RE.search(raw)
     if not match:
         return None
     try:
@@ -1130,4 +1435,8 @@ def _extract_json_object(raw: str) -> dict[str, Any] | None:
 def _truncate(value: str, max_len: int) -> str:
     if len(value) <= max_len:
         return value
-    return value[: max_len - 3].rstrip() + "..."
+    head = value[: max_len - 3]
+    # rstrip() would copy the head again; only pay for it when there is whitespace to drop.
+    if head and head[-1].isspace():
+        head = head.rstrip()
+    return head + "..."
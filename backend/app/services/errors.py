@@ -1,8 +1,9 @@
 """
 Service-layer exceptions.
 
-Endpoints catch these and translate them to HTTPException with the
-appropriate HTTP status code.
+Endpoints let these propagate; app.core.errors registers one exception
+handler per class that renders the standard error body with the status
+code below.
 
 Mapping:
     ServiceNotFound      → 404
@@ -9,7 +9,7 @@ Functions:
 """
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
@@ -24,7 +24,7 @@ from app.schemas.favorite import (
 )
 from app.schemas.restaurant import RestaurantCard
 from app.services.errors import ServiceConflict, ServiceNotFound
-from app.services.restaurant_service import _fetch_ratings, _orm_to_card
+from app.services.restaurant_service import _orm_to_card, _rating_stats
 
 
 # ---------------------------------------------------------------------------
@@ -41,30 +41,20 @@ def add_favorite(
     Raises ServiceNotFound if the restaurant does not exist.
     Raises ServiceConflict if already favorited.
     Returns FavoriteStatusResponse(restaurant_id=..., favorited=True).
-    """
-    # Verify restaurant exists
-    exists = db.execute(
-        select(Restaurant.id).where(Restaurant.id == restaurant_id)
-    ).scalar_one_or_none()
-    if exists is None:
-        raise ServiceNotFound(f"Restaurant {restaurant_id} not found.")
-
-    # Check duplicate
-    already = db.execute(
-        select(Favorite).where(
-            Favorite.user_id == user_id,
-            Favorite.restaurant_id == restaurant_id,
-        )
-    ).scalar_one_or_none()
-    if already is not None:
-        raise ServiceConflict("Restaurant is already in your favorites.")
 
-    fav = Favorite(user_id=user_id, restaurant_id=restaurant_id)
-    db.add(fav)
+    The happy path is a single INSERT: the unique key and the restaurant
+    foreign key reject bad rows, and only then do we look up which one fired.
+    """
     try:
+        db.execute(insert(Favorite).values(user_id=user_id, restaurant_id=restaurant_id))
         db.commit()
     except IntegrityError:
         db.rollback()
+        exists = db.execute(
+            select(Restaurant.id).where(Restaurant.id == restaurant_id)
+        ).scalar_one_or_none()
+        if exists is None:
+            raise ServiceNotFound(f"Restaurant {restaurant_id} not found.")
         raise ServiceConflict("Restaurant is already in your favorites.")
 
     return FavoriteStatusResponse(restaurant_id=restaurant_id, favorited=True)
@@ -83,17 +73,15 @@ def remove_favorite(
     Unfavorite a restaurant.
     Raises ServiceNotFound if this restaurant is not in the user's favorites.
     """
-    fav = db.execute(
-        select(Favorite).where(
+    result = db.execute(
+        delete(Favorite).where(
             Favorite.user_id == user_id,
             Favorite.restaurant_id == restaurant_id,
         )
-    ).scalar_one_or_none()
-
-    if fav is None:
+    )
+    if result.rowcount == 0:
+        db.rollback()
         raise ServiceNotFound("This restaurant is not in your favorites.")
-
-    db.delete(fav)
     db.commit()
 
 
@@ -118,8 +106,10 @@ def get_favorites(
         .order_by(Favorite.created_at.desc(), Favorite.id.desc())
     )
 
+    # Plain COUNT on the user_id filter: served from idx_favorites_user_id,
+    # without wrapping (and ordering) the paged query in a derived table.
     total: int = db.execute(
-        select(func.count()).select_from(fav_stmt.subquery())
+        select(func.count()).select_from(Favorite).where(Favorite.user_id == user_id)
     ).scalar_one()
 
     fav_ids = db.execute(
@@ -140,8 +130,7 @@ def get_favorites(
     order_map = {rid: idx for idx, rid in enumerate(fav_ids)}
     restaurants.sort(key=lambda r: order_map.get(r.id, 9999))
 
-    ratings = _fetch_ratings(db, [r.id for r in restaurants])
-    items = [_orm_to_card(r, *ratings.get(r.id, (0.0, 0))) for r in restaurants]
+    items = [_orm_to_card(r, *_rating_stats(r)) for r in restaurants]
 
     return FavoritesListResponse(items=items, total=total)
 
@@ -193,11 +182,7 @@ def get_user_history(db: Session, user_id: int) -> UserHistoryResponse:
         .order_by(Restaurant.created_at.desc())
     ).scalars().all()
 
-    rids = [r.id for r in added]
-    ratings = _fetch_ratings(db, rids)
-    my_restaurants_added = [
-        _orm_to_card(r, *ratings.get(r.id, (0.0, 0))) for r in added
-    ]
+    my_restaurants_added = [_orm_to_card(r, *_rating_stats(r)) for r in added]
 
     return UserHistoryResponse(
         my_reviews=my_reviews,
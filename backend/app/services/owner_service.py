@@ -35,9 +35,10 @@ from app.services.errors import (
     ServiceNotFound,
 )
 from app.services.restaurant_service import (
-    _fetch_ratings,
+    _invalidate_search_pages,
     _orm_to_card,
     _orm_to_response,
+    _rating_stats,
 )
 
 
@@ -60,7 +61,6 @@ def update_owner_profile(
 
     db.add(owner)
     db.commit()
-    db.refresh(owner)
     return OwnerProfileResponse.model_validate(owner)
 
 
@@ -97,6 +97,7 @@ def create_owner_restaurant(
     )
     db.add(restaurant)
     db.commit()
+    _invalidate_search_pages()
     db.refresh(restaurant)
     restaurant.photos = []
     return _orm_to_response(restaurant, average_rating=0.0, review_count=0)
@@ -133,10 +134,13 @@ def update_owner_restaurant(
 
     db.add(restaurant)
     db.commit()
-    db.refresh(restaurant)
+    _invalidate_search_pages()
+    # Reload only the server-maintained columns (ON UPDATE timestamp and the
+    # trigger-kept rating counters) in one SELECT; the eagerly loaded photos
+    # are unchanged by this UPDATE and need no second query.
+    db.refresh(restaurant, ["updated_at", "review_count", "rating_sum"])
 
-    ratings = _fetch_ratings(db, [restaurant_id])
-    avg, cnt = ratings.get(restaurant_id, (0.0, 0))
+    avg, cnt = _rating_stats(restaurant)
     return _orm_to_response(restaurant, average_rating=avg, review_count=cnt)
 
 
@@ -204,7 +208,15 @@ def get_owner_restaurant_reviews(
     ).scalar_one()
 
     rows = db.execute(
-        select(Review, User.name.label("user_name"))
+        select(
+            Review.id,
+            Review.restaurant_id,
+            Review.rating,
+            Review.comment,
+            User.name.label("user_name"),
+            Review.created_at,
+            Review.updated_at,
+        )
         .join(User, User.id == Review.user_id)
         .where(Review.restaurant_id == restaurant_id)
         .order_by(Review.created_at.desc(), Review.id.desc())
@@ -214,13 +226,13 @@ def get_owner_restaurant_reviews(
 
     items = [
         ReviewResponse(
-            id=row.Review.id,
-            restaurant_id=row.Review.restaurant_id,
-            rating=row.Review.rating,
-            comment=row.Review.comment,
+            id=row.id,
+            restaurant_id=row.restaurant_id,
+            rating=row.rating,
+            comment=row.comment,
             user_name=row.user_name,
-            created_at=row.Review.created_at,
-            updated_at=row.Review.updated_at,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
         for row in rows
     ]
@@ -248,38 +260,29 @@ def get_owner_dashboard(db: Session, owner_id: int) -> OwnerDashboardResponse:
         .order_by(Restaurant.created_at.desc())
     ).scalars().all()
 
-    rids = [r.id for r in restaurants]
-
-    # Aggregate stats across all claimed restaurants
-    if rids:
-        agg_row = db.execute(
-            select(
-                func.count(Review.id).label("total"),
-                func.avg(Review.rating).label("avg"),
-            ).where(Review.restaurant_id.in_(rids))
-        ).one()
-
-        dist_rows = db.execute(
-            select(Review.rating, func.count(Review.id).label("cnt"))
-            .where(Review.restaurant_id.in_(rids))
-            .group_by(Review.rating)
-        ).all()
-    else:
-        agg_row = type("Row", (), {"total": 0, "avg": None})()
-        dist_rows = []
-
-    total_reviews = int(agg_row.total or 0)
-    avg_rating = round(float(agg_row.avg), 2) if agg_row.avg is not None else 0.0
-
-    # Build full distribution (fill missing ratings with 0)
+    # Cards read the trigger-maintained counters, like every other restaurant
+    # card, so the owner sees the same numbers as the public listing.
+    claimed_restaurants = [_orm_to_card(r, *_rating_stats(r)) for r in restaurants]
+
+    # The histogram has no counter columns; one grouped pass over the ids
+    # already in hand (no join back to restaurants) is an index-only range
+    # scan of idx_reviews_restaurant_rating. The totals come from the same
+    # rows, so they always add up to the distribution even if the counters
+    # have drifted (see db/008 and scripts/reconcile_rating_counters.py).
+    restaurant_ids = [r.id for r in restaurants]
+    rating_rows = db.execute(
+        select(Review.rating, func.count().label("cnt"))
+        .where(Review.restaurant_id.in_(restaurant_ids))
+        .group_by(Review.rating)
+    ).all() if restaurant_ids else []
+
     rating_distribution: dict[int, int] = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for row in dist_rows:
-        rating_distribution[int(row.rating)] = int(row.cnt)
+    for row in rating_rows:
+        rating_distribution[int(row.rating)] += int(row.cnt)
 
-    ratings = _fetch_ratings(db, rids)
-    claimed_restaurants = [
-        _orm_to_card(r, *ratings.get(r.id, (0.0, 0))) for r in restaurants
-    ]
+    total_reviews = sum(rating_distribution.values())
+    rating_sum = sum(rating * cnt for rating, cnt in rating_distribution.items())
+    avg_rating = round(rating_sum / total_reviews, 2) if total_reviews else 0.0
 
     return OwnerDashboardResponse(
         claimed_count=len(restaurants),
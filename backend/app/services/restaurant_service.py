@@ -9,10 +9,13 @@ Functions:
 """
 from __future__ import annotations
 
-import uuid
+import os
+import secrets
+import threading
 from pathlib import Path
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import UploadFile
 from sqlalchemy import cast, func, or_, select, String
 from sqlalchemy.orm import Session, selectinload
@@ -21,7 +24,6 @@ from app.core.config import get_settings
 from app.models.owner import Owner
 from app.models.restaurant import Restaurant
 from app.models.restaurant_photo import RestaurantPhoto
-from app.models.review import Review
 from app.models.user import User
 from app.schemas.restaurant import (
     PhotoResponse,
@@ -46,6 +48,13 @@ _ALLOWED_MIME_TYPES = {"image/jpeg", "image/png", "image/webp"}
 _MAX_PHOTO_BYTES = 10 * 1024 * 1024   # 10 MB
 _MAX_PHOTOS_TOTAL = 5
 
+# Search result pages: (filters, sort, page, limit) -> RestaurantSearchResponse.
+# Any restaurant, photo or review write clears the whole cache (a write can
+# move a restaurant in or out of any filter/sort), so the TTL only bounds
+# staleness from writes made by other processes.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=30)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Private helpers
@@ -103,7 +112,8 @@ def _orm_to_card(
     review_count: int = 0,
 ) -> RestaurantCard:
     cover = r.photos[0].photo_url if r.photos else None
-    return RestaurantCard(
+    # Column types already match the card fields; skip re-validating each list row.
+    return RestaurantCard.model_construct(
         id=r.id,
         name=r.name,
         cuisine_type=r.cuisine_type,
@@ -118,20 +128,16 @@ def _orm_to_card(
     )
 
 
-def _fetch_ratings(db: Session, restaurant_ids: list[int]) -> dict[int, tuple[float, int]]:
-    """Return {restaurant_id: (avg_rating, review_count)} for a batch of IDs."""
-    if not restaurant_ids:
-        return {}
-    rows = db.execute(
-        select(
-            Review.restaurant_id,
-            func.avg(Review.rating).label("avg"),
-            func.count(Review.id).label("cnt"),
-        )
-        .where(Review.restaurant_id.in_(restaurant_ids))
-        .group_by(Review.restaurant_id)
-    ).all()
-    return {row.restaurant_id: (round(float(row.avg), 2), int(row.cnt)) for row in rows}
+def _invalidate_search_pages() -> None:
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
+def _rating_stats(r: Restaurant) -> tuple[float, int]:
+    """Return (avg_rating, review_count) from the restaurant's counter columns."""
+    if not r.review_count:
+        return 0.0, 0
+    return round(r.rating_sum / r.review_count, 2), r.review_count
 
 
 # ---------------------------------------------------------------------------
@@ -164,6 +170,7 @@ def create_restaurant(
     )
     db.add(restaurant)
     db.commit()
+    _invalidate_search_pages()
     db.refresh(restaurant)
     restaurant.photos = []   # avoid lazy-load on fresh object
     return _orm_to_response(restaurant, average_rating=0.0, review_count=0)
@@ -184,8 +191,7 @@ def get_restaurant_by_id(db: Session, restaurant_id: int) -> RestaurantResponse:
     if restaurant is None:
         raise ServiceNotFound(f"Restaurant {restaurant_id} not found.")
 
-    ratings = _fetch_ratings(db, [restaurant_id])
-    avg, cnt = ratings.get(restaurant_id, (0.0, 0))
+    avg, cnt = _rating_stats(restaurant)
     return _orm_to_response(restaurant, average_rating=avg, review_count=cnt)
 
 
@@ -206,20 +212,26 @@ def search_restaurants(
 
     keywords is matched against name, description, and the amenities JSON
     column (cast to string for a LIKE search so "wifi" matches ["WiFi",...]).
+    Pages are cached briefly in-process (see _SEARCH_CACHE).
     """
-    stmt = select(Restaurant).options(selectinload(Restaurant.photos))
+    cache_key = (name, cuisine, keywords, city, zip_code, sort, page, limit)
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
+    filters = []
     if name:
-        stmt = stmt.where(Restaurant.name.ilike(f"%{name}%"))
+        filters.append(Restaurant.name.ilike(f"%{name}%"))
     if cuisine:
-        stmt = stmt.where(Restaurant.cuisine_type.ilike(f"%{cuisine}%"))
+        filters.append(Restaurant.cuisine_type.ilike(f"%{cuisine}%"))
     if city:
-        stmt = stmt.where(Restaurant.city.ilike(f"%{city}%"))
+        filters.append(Restaurant.city.ilike(f"%{city}%"))
     if zip_code:
-        stmt = stmt.where(Restaurant.zip_code == zip_code)
+        filters.append(Restaurant.zip_code == zip_code)
     if keywords:
         kw = f"%{keywords}%"
-        stmt = stmt.where(
+        filters.append(
             or_(
                 Restaurant.name.ilike(kw),
                 Restaurant.description.ilike(kw),
@@ -227,29 +239,35 @@ def search_restaurants(
             )
         )
 
-    # Sorting — Phase 4 will replace with real AVG(rating) subquery
-    if sort in ("name", "rating", "review_count"):
-        stmt = stmt.order_by(Restaurant.name.asc())
+    # Count on the bare filters, not a derived table of the sorted row query.
+    total: int = db.execute(
+        select(func.count()).select_from(Restaurant).where(*filters)
+    ).scalar_one()
+
+    stmt = select(Restaurant).options(selectinload(Restaurant.photos)).where(*filters)
 
-    # Count total before applying pagination
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    total: int = db.execute(count_stmt).scalar_one()
+    # Sorting — rating/review_count read the counter columns; name breaks ties.
+    # NULLIF leaves unreviewed restaurants NULL, which MySQL sorts last on DESC.
+    if sort == "rating":
+        stmt = stmt.order_by(
+            (Restaurant.rating_sum / func.nullif(Restaurant.review_count, 0)).desc()
+        )
+    elif sort == "review_count":
+        stmt = stmt.order_by(Restaurant.review_count.desc())
+    stmt = stmt.order_by(Restaurant.name.asc())
 
     stmt = stmt.offset((page - 1) * limit).limit(limit)
     restaurants = db.execute(stmt).scalars().all()
 
-    rids = [r.id for r in restaurants]
-    ratings = _fetch_ratings(db, rids)
-
-    return RestaurantSearchResponse(
-        items=[
-            _orm_to_card(r, *ratings.get(r.id, (0.0, 0)))
-            for r in restaurants
-        ],
+    result = RestaurantSearchResponse(
+        items=[_orm_to_card(r, *_rating_stats(r)) for r in restaurants],
         total=total,
         page=page,
         limit=limit,
     )
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[cache_key] = result
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -337,7 +355,7 @@ async def upload_photos(
         if not f.filename:
             raise ServiceBadRequest("Empty filename.")
 
-        ext = f".{f.filename.rsplit('.', 1)[-1].lower()}" if "." in f.filename else ""
+        ext = os.path.splitext(f.filename)[1].lower()
         if ext not in _ALLOWED_EXTENSIONS:
             raise ServiceBadRequest(
                 f"Unsupported format '{ext}'. Use JPEG, PNG, or WEBP."
@@ -349,7 +367,7 @@ async def upload_photos(
         if len(data) > _MAX_PHOTO_BYTES:
             raise ServiceBadRequest("Each image must be 10 MB or less.")
 
-        filename = f"restaurant-{restaurant_id}-{uuid.uuid4().hex}{ext}"
+        filename = f"restaurant-{restaurant_id}-{secrets.token_hex(16)}{ext}"
         (_photos_dir / filename).write_bytes(data)
 
         photo = RestaurantPhoto(
@@ -371,4 +389,5 @@ async def upload_photos(
         )
 
     db.commit()
+    _invalidate_search_pages()   # first photo becomes the card's cover
     return saved
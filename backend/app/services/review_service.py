@@ -10,25 +10,43 @@ Functions:
 """
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from cachetools import TTLCache
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, aliased
 
 from app.models.review import Review
 from app.models.user import User
 from app.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
 from app.services.errors import (
+    ServiceBadRequest,
     ServiceConflict,
     ServiceForbidden,
     ServiceNotFound,
 )
+from app.services.restaurant_service import _invalidate_search_pages
+
+
+# Public review pages: (restaurant_id, page, limit, after_id) -> response dict.
+# Writes below drop the restaurant's pages; the TTL bounds how long a
+# renamed reviewer's old user_name can be served.
+_REVIEW_PAGE_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_REVIEW_PAGE_CACHE_LOCK = threading.Lock()
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _invalidate_review_pages(restaurant_id: int) -> None:
+    with _REVIEW_PAGE_CACHE_LOCK:
+        stale = [key for key in _REVIEW_PAGE_CACHE if key[0] == restaurant_id]
+        for key in stale:
+            _REVIEW_PAGE_CACHE.pop(key, None)
+
+
 def _to_response(review: Review, user_name: str) -> ReviewResponse:
     return ReviewResponse(
         id=review.id,
@@ -74,6 +92,8 @@ def create_review(
     db.add(review)
     db.commit()
     db.refresh(review)
+    _invalidate_review_pages(restaurant_id)
+    _invalidate_search_pages()   # rating / review_count sorts moved
 
     user = db.execute(select(User).where(User.id == user_id)).scalar_one()
     return _to_response(review, user.name)
@@ -109,6 +129,8 @@ def update_review(
 
     db.commit()
     db.refresh(review)
+    _invalidate_review_pages(review.restaurant_id)
+    _invalidate_search_pages()
 
     user = db.execute(select(User).where(User.id == user_id)).scalar_one()
     return _to_response(review, user.name)
@@ -134,6 +156,8 @@ def delete_review(db: Session, review_id: int, user_id: int) -> None:
 
     db.delete(review)
     db.commit()
+    _invalidate_review_pages(review.restaurant_id)
+    _invalidate_search_pages()
 
 
 # ---------------------------------------------------------------------------
@@ -145,28 +169,87 @@ def get_reviews_for_restaurant(
     restaurant_id: int,
     page: int = 1,
     limit: int = 20,
+    after_id: Optional[int] = None,
 ) -> dict:
     """
     Return paginated reviews for a restaurant with user_name joined from users.
     Response: {"items": [...], "total": int, "page": int, "limit": int}
+    Pages are cached briefly in-process (see _REVIEW_PAGE_CACHE).
+
+    after_id switches to keyset pagination: the next `limit` reviews after
+    that review in (created_at, id) order, served straight from
+    idx_reviews_restaurant_created instead of scanning past an OFFSET.
+    `page` is then ignored. Raises ServiceBadRequest for an unknown cursor.
     """
+    cache_key = (restaurant_id, page, limit, after_id)
+    with _REVIEW_PAGE_CACHE_LOCK:
+        cached = _REVIEW_PAGE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Plain columns, not Review entities: no ORM instances, identity-map
+    # entries or lazy loads for a read-only page.
     base_stmt = (
-        select(Review, User.name.label("user_name"))
+        select(
+            Review.id,
+            Review.restaurant_id,
+            Review.rating,
+            Review.comment,
+            User.name.label("user_name"),
+            Review.created_at,
+            Review.updated_at,
+        )
         .join(User, User.id == Review.user_id)
         .where(Review.restaurant_id == restaurant_id)
         .order_by(Review.created_at.desc(), Review.id.desc())
     )
 
     total: int = db.execute(
-        select(func.count()).select_from(
-            select(Review).where(Review.restaurant_id == restaurant_id).subquery()
-        )
+        select(func.count(Review.id)).where(Review.restaurant_id == restaurant_id)
     ).scalar_one()
 
-    rows = db.execute(base_stmt.offset((page - 1) * limit).limit(limit)).all()
+    if after_id is None:
+        page_stmt = base_stmt.offset((page - 1) * limit)
+    else:
+        cursor_exists = db.execute(
+            select(Review.id).where(
+                Review.id == after_id,
+                Review.restaurant_id == restaurant_id,
+            )
+        ).first()
+        if cursor_exists is None:
+            raise ServiceBadRequest(f"Review {after_id} is not a valid cursor for this restaurant.")
+        cursor_review = aliased(Review)
+        cursor_created_at = (
+            select(cursor_review.created_at)
+            .where(cursor_review.id == after_id)
+            .scalar_subquery()
+        )
+        page_stmt = base_stmt.where(
+            or_(
+                Review.created_at < cursor_created_at,
+                and_(Review.created_at == cursor_created_at, Review.id < after_id),
+            )
+        )
 
-    items = [_to_response(row.Review, row.user_name) for row in rows]
-    return {"items": items, "total": total, "page": page, "limit": limit}
+    rows = db.execute(page_stmt.limit(limit)).all()
+
+    items = [
+        ReviewResponse(
+            id=row.id,
+            restaurant_id=row.restaurant_id,
+            rating=row.rating,
+            comment=row.comment,
+            user_name=row.user_name,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        for row in rows
+    ]
+    result = {"items": items, "total": total, "page": page, "limit": limit}
+    with _REVIEW_PAGE_CACHE_LOCK:
+        _REVIEW_PAGE_CACHE[cache_key] = result
+    return result
 
 
 # ---------------------------------------------------------------------------
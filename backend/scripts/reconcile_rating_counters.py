@@ -0,0 +1,77 @@
+"""Recompute restaurants.review_count / rating_sum from reviews and report drift.
+
+The db/008 triggers keep the counters current for direct writes to reviews,
+but MySQL skips triggers for foreign-key cascades, so deleting a user leaves
+the counters of every restaurant they reviewed too high. Run this nightly
+(see README) to detect and repair that drift.
+
+    python scripts/reconcile_rating_counters.py [--dry-run]
+"""
+import argparse
+import logging
+from pathlib import Path
+import sys
+
+from sqlalchemy import func, or_, select, update
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.db.session import SessionLocal
+from app.models.restaurant import Restaurant
+from app.models.review import Review
+
+logger = logging.getLogger("reconcile_rating_counters")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    actual_count = (
+        select(func.count()).where(Review.restaurant_id == Restaurant.id).scalar_subquery()
+    )
+    actual_sum = (
+        select(func.coalesce(func.sum(Review.rating), 0))
+        .where(Review.restaurant_id == Restaurant.id)
+        .scalar_subquery()
+    )
+    with SessionLocal() as db:
+        drifted = db.execute(
+            select(
+                Restaurant.id,
+                Restaurant.name,
+                Restaurant.review_count,
+                Restaurant.rating_sum,
+                actual_count.label("actual_count"),
+                actual_sum.label("actual_sum"),
+            ).where(
+                or_(Restaurant.review_count != actual_count, Restaurant.rating_sum != actual_sum)
+            )
+        ).all()
+
+        for row in drifted:
+            logger.warning(
+                "restaurant %s (%s): review_count %s -> %s, rating_sum %s -> %s",
+                row.id, row.name, row.review_count, row.actual_count, row.rating_sum, row.actual_sum,
+            )
+        if drifted and not args.dry_run:
+            # Recomputed inside the UPDATE itself, so a review written since the
+            # scan above is still counted.
+            db.execute(
+                update(Restaurant)
+                .where(Restaurant.id.in_([row.id for row in drifted]))
+                .values(review_count=actual_count, rating_sum=actual_sum)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+    action = "found (dry run)" if args.dry_run else "reconciled"
+    logger.info("%d restaurant(s) with drifted rating counters %s", len(drifted), action)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ Uses the live yelp_lab1 DB with per-test transaction rollback via SAVEPOINT.
 from __future__ import annotations
 
 import pytest
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.favorite import Favorite  # noqa: F401
@@ -375,6 +376,21 @@ class TestGetOwnerDashboard:
         assert result.rating_distribution[3] == 1
         assert result.rating_distribution[1] == 0
 
+    def test_distribution_adds_up_to_total_reviews(self, db: Session):
+        owner = make_owner(db)
+        r1 = make_restaurant(db, owner_id=owner.id)
+        r2 = make_restaurant(db, name="Second", owner_id=owner.id)
+        make_review(db, r1.id, make_user(db).id, rating=5)
+        make_review(db, r1.id, make_user(db).id, rating=1)
+        make_review(db, r2.id, make_user(db).id, rating=4)
+        # Simulate counter drift (e.g. a cascade delete that skipped the triggers).
+        db.execute(
+            update(Restaurant).where(Restaurant.id == r1.id).values(review_count=7, rating_sum=30)
+        )
+        result = owner_service.get_owner_dashboard(db, owner.id)
+        assert sum(result.rating_distribution.values()) == result.total_reviews == 3
+        assert result.avg_rating == 3.33
+
     def test_claimed_restaurants_list(self, db: Session):
         owner = make_owner(db)
         r = make_restaurant(db, name="My Restaurant", owner_id=owner.id)
@@ -382,6 +398,19 @@ class TestGetOwnerDashboard:
         assert len(result.claimed_restaurants) == 1
         assert result.claimed_restaurants[0].name == "My Restaurant"
 
+    def test_claimed_restaurant_card_ratings(self, db: Session):
+        owner = make_owner(db)
+        rated = make_restaurant(db, name="Rated", owner_id=owner.id)
+        make_restaurant(db, name="Unrated", owner_id=owner.id)
+        make_review(db, rated.id, make_user(db).id, rating=5)
+        make_review(db, rated.id, make_user(db).id, rating=2)
+        result = owner_service.get_owner_dashboard(db, owner.id)
+        cards = {c.name: c for c in result.claimed_restaurants}
+        assert cards["Rated"].average_rating == 3.5
+        assert cards["Rated"].review_count == 2
+        assert cards["Unrated"].average_rating == 0.0
+        assert cards["Unrated"].review_count == 0
+
     def test_other_owners_restaurants_excluded(self, db: Session):
         owner_a = make_owner(db)
         owner_b = make_owner(db)
@@ -21,7 +21,8 @@ from app.models.restaurant_photo import RestaurantPhoto  # noqa: F401 — regist
 from app.models.user import User
 from app.models.user_preference import UserPreference  # noqa: F401 — registers model
 from app.schemas.restaurant import RestaurantCreate
-from app.services import restaurant_service
+from app.schemas.review import ReviewCreate
+from app.services import restaurant_service, review_service
 from app.services.errors import (
     ServiceBadRequest,
     ServiceForbidden,
@@ -238,6 +239,39 @@ class TestSearchRestaurants:
             result = restaurant_service.search_restaurants(db, sort=s)
             assert result.total >= 2, f"sort={s} returned wrong total"
 
+    def _seed_sort_cases(self, db):
+        """Three restaurants in their own city: 2 reviews avg 3.0, 1 review avg 5.0, none."""
+        owner = make_user(db, "sort@test.com")
+        ids = {}
+        for name in ("Alpha Diner", "Beta Bistro", "Gamma Grill"):
+            ids[name] = restaurant_service.create_restaurant(db, RestaurantCreate(
+                name=name, city="Sortville",
+            ), owner.id).id
+        reviews = [("Alpha Diner", 2), ("Alpha Diner", 4), ("Beta Bistro", 5)]
+        for i, (name, rating) in enumerate(reviews):
+            reviewer = make_user(db, f"sort{i}@test.com")
+            review_service.create_review(db, ids[name], ReviewCreate(rating=rating), reviewer.id)
+
+    def test_sort_by_rating_desc_unreviewed_last(self, db):
+        self._seed_sort_cases(db)
+        result = restaurant_service.search_restaurants(db, city="Sortville", sort="rating")
+        assert [r.name for r in result.items] == ["Beta Bistro", "Alpha Diner", "Gamma Grill"]
+
+    def test_sort_by_review_count_desc(self, db):
+        self._seed_sort_cases(db)
+        result = restaurant_service.search_restaurants(db, city="Sortville", sort="review_count")
+        assert [r.name for r in result.items] == ["Alpha Diner", "Beta Bistro", "Gamma Grill"]
+
+    def test_cached_search_sees_new_restaurant(self, db):
+        """Creating a restaurant must not leave a stale cached page behind."""
+        before = restaurant_service.search_restaurants(db, name="Sushi")
+        user = make_user(db, "s2@test.com")
+        restaurant_service.create_restaurant(db, RestaurantCreate(
+            name="Sushi Corner", city="San Jose", state="CA",
+        ), user.id)
+        after = restaurant_service.search_restaurants(db, name="Sushi")
+        assert after.total == before.total + 1
+
 
 # ---------------------------------------------------------------------------
 # Test: upload_photos — auth + quota validation (no real file I/O)
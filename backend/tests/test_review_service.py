@@ -22,7 +22,12 @@ from app.models.user_preference import UserPreference  # noqa: F401
 from app.schemas.restaurant import RestaurantCreate
 from app.schemas.review import ReviewCreate, ReviewUpdate
 from app.services import restaurant_service, review_service
-from app.services.errors import ServiceConflict, ServiceForbidden, ServiceNotFound
+from app.services.errors import (
+    ServiceBadRequest,
+    ServiceConflict,
+    ServiceForbidden,
+    ServiceNotFound,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -232,6 +237,38 @@ class TestGetReviewsForRestaurant:
         assert len(page1["items"]) == 2
         assert len(page2["items"]) == 1
 
+    def test_new_review_visible_after_cached_read(self, db):
+        u = make_user(db, "cache@review.com", "Nina")
+        rid = make_restaurant(db, u.id)
+
+        assert review_service.get_reviews_for_restaurant(db, rid)["total"] == 0
+        review_service.create_review(db, rid, ReviewCreate(rating=4), u.id)
+
+        result = review_service.get_reviews_for_restaurant(db, rid)
+        assert result["total"] == 1
+
+    def test_after_id_cursor_continues_listing(self, db):
+        u1 = make_user(db, "ks1@review.com", "Omar")
+        u2 = make_user(db, "ks2@review.com", "Pia")
+        u3 = make_user(db, "ks3@review.com", "Quinn")
+        rid = make_restaurant(db, u1.id)
+        for u in [u1, u2, u3]:
+            review_service.create_review(db, rid, ReviewCreate(rating=3), u.id)
+
+        page1 = review_service.get_reviews_for_restaurant(db, rid, limit=2)
+        rest = review_service.get_reviews_for_restaurant(
+            db, rid, limit=2, after_id=page1["items"][-1].id
+        )
+        page2 = review_service.get_reviews_for_restaurant(db, rid, page=2, limit=2)
+
+        assert [r.id for r in rest["items"]] == [r.id for r in page2["items"]]
+
+    def test_unknown_cursor_raises_service_bad_request(self, db):
+        u = make_user(db, "ksbad@review.com")
+        rid = make_restaurant(db, u.id)
+        with pytest.raises(ServiceBadRequest):
+            review_service.get_reviews_for_restaurant(db, rid, after_id=999999)
+
     def test_ordered_newest_first(self, db):
         u1 = make_user(db, "ord1@review.com", "Leo")
         u2 = make_user(db, "ord2@review.com", "Mia")
@@ -291,3 +328,28 @@ class TestGetAvgRating:
         avg, _ = review_service.get_avg_rating(db, rid)
         # 8/3 = 2.666... → rounds to 2.67
         assert avg == round(8 / 3, 2)
+
+
+# ---------------------------------------------------------------------------
+# TestRatingCounters — restaurants.review_count / rating_sum (db/008 triggers)
+# ---------------------------------------------------------------------------
+
+class TestRatingCounters:
+    def test_counters_follow_review_writes(self, db):
+        u1 = make_user(db, "cnt1@review.com", "Quinn")
+        u2 = make_user(db, "cnt2@review.com", "Rosa")
+        rid = make_restaurant(db, u1.id)
+
+        review_service.create_review(db, rid, ReviewCreate(rating=2), u1.id)
+        second = review_service.create_review(db, rid, ReviewCreate(rating=5), u2.id)
+        review_service.update_review(db, second.id, ReviewUpdate(rating=3), u2.id)
+
+        db.expire_all()  # counters are written by the DB, not the session
+        resp = restaurant_service.get_restaurant_by_id(db, rid)
+        assert (resp.average_rating, resp.review_count) == (2.5, 2)
+        assert (resp.average_rating, resp.review_count) == review_service.get_avg_rating(db, rid)
+
+        review_service.delete_review(db, second.id, u2.id)
+        db.expire_all()
+        resp = restaurant_service.get_restaurant_by_id(db, rid)
+        assert (resp.average_rating, resp.review_count) == (2.0, 1)
@@ -0,0 +1,11 @@
+-- Review list pagination index
+-- GET /restaurants/{id}/reviews orders by (created_at DESC, id DESC) within a
+-- restaurant. This composite index serves both the OFFSET pages and the
+-- `after_id` keyset cursor without a filesort.
+--
+-- Apply with: mysql -u root -p yelp_lab1 < db/005_review_list_index.sql
+
+USE yelp_lab1;
+
+CREATE INDEX idx_reviews_restaurant_created
+  ON reviews (restaurant_id, created_at, id);
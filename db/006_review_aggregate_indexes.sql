@@ -0,0 +1,15 @@
+-- Review aggregate / history indexes
+-- Card and dashboard ratings run AVG/COUNT(rating) GROUP BY restaurant_id (and
+-- rating, for the dashboard distribution); (restaurant_id, rating) lets MySQL
+-- answer them from the index alone. The favorites page lists a user's reviews
+-- ordered by (created_at DESC, id DESC), served by (user_id, created_at, id).
+--
+-- Apply with: mysql -u root -p yelp_lab1 < db/006_review_aggregate_indexes.sql
+
+USE yelp_lab1;
+
+CREATE INDEX idx_reviews_restaurant_rating
+  ON reviews (restaurant_id, rating);
+
+CREATE INDEX idx_reviews_user_created
+  ON reviews (user_id, created_at, id);
@@ -0,0 +1,11 @@
+-- Restaurant photo lookup index
+-- Photos are loaded per restaurant ordered by id; the first one is the card's
+-- cover_photo_url. Replaces the unnamed index MySQL created implicitly for the
+-- restaurant_id foreign key (it is dropped automatically once this one exists).
+--
+-- Apply with: mysql -u root -p yelp_lab1 < db/007_restaurant_photos_index.sql
+
+USE yelp_lab1;
+
+CREATE INDEX idx_restaurant_photos_restaurant_id
+  ON restaurant_photos (restaurant_id, id);
@@ -0,0 +1,54 @@
+-- Restaurant rating counters
+-- Cards, details and search read a restaurant's rating from two counter
+-- columns instead of aggregating reviews per request; search can now sort by
+-- rating and review_count. The triggers below keep the counters current for
+-- every INSERT/UPDATE/DELETE on reviews.
+--
+-- NOTE: MySQL does not fire triggers for foreign-key cascades. Reviews removed
+-- by ON DELETE CASCADE from users leave the counters stale. The nightly job
+-- backend/scripts/reconcile_rating_counters.py (see README) logs and repairs
+-- that drift; step 2 below can also be re-run by hand after bulk user deletes.
+--
+-- Apply with: mysql -u root -p yelp_lab1 < db/008_restaurant_rating_counters.sql
+
+USE yelp_lab1;
+
+-- 1. Counter columns
+ALTER TABLE restaurants
+  ADD COLUMN review_count INT NOT NULL DEFAULT 0,
+  ADD COLUMN rating_sum INT NOT NULL DEFAULT 0;
+
+-- 2. Backfill / reconciliation (safe to re-run)
+UPDATE restaurants r
+  LEFT JOIN (
+    SELECT restaurant_id, COUNT(*) AS cnt, SUM(rating) AS total
+    FROM reviews
+    GROUP BY restaurant_id
+  ) agg ON agg.restaurant_id = r.id
+SET r.review_count = COALESCE(agg.cnt, 0),
+    r.rating_sum = COALESCE(agg.total, 0);
+
+-- 3. Triggers (single statements, so no DELIMITER change is needed)
+CREATE TRIGGER trg_reviews_after_insert AFTER INSERT ON reviews
+FOR EACH ROW
+  UPDATE restaurants
+  SET review_count = review_count + 1,
+      rating_sum = rating_sum + NEW.rating
+  WHERE id = NEW.restaurant_id;
+
+CREATE TRIGGER trg_reviews_after_update AFTER UPDATE ON reviews
+FOR EACH ROW
+  UPDATE restaurants
+  SET review_count = review_count
+        + (id = NEW.restaurant_id) - (id = OLD.restaurant_id),
+      rating_sum = rating_sum
+        + IF(id = NEW.restaurant_id, NEW.rating, 0)
+        - IF(id = OLD.restaurant_id, OLD.rating, 0)
+  WHERE id IN (OLD.restaurant_id, NEW.restaurant_id);
+
+CREATE TRIGGER trg_reviews_after_delete AFTER DELETE ON reviews
+FOR EACH ROW
+  UPDATE restaurants
+  SET review_count = review_count - 1,
+      rating_sum = rating_sum - OLD.rating
+  WHERE id = OLD.restaurant_id;